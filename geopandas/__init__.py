@@ -3,11 +3,14 @@ try:
 except ImportError:
     __version__ = '0.1.0.dev-unknown'
 
+from geopandas.parallel import options
 from geopandas.geoseries import GeoSeries
 from geopandas.geodataframe import GeoDataFrame
 
-from geopandas.io.file import read_file
+from geopandas.io.file import read_file, read_geojsonseq
 from geopandas.io.sql import read_postgis
+from geopandas.io.parquet import read_parquet
+from geopandas.tools import sjoin
 
 # make the interactive namespace easier to use
 # for `from geopandas import *` demos.
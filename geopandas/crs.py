@@ -0,0 +1,227 @@
+"""
+Coordinate reference system helpers.
+"""
+try:
+    from collections import OrderedDict
+except ImportError:
+    # Python 2.6
+    from ordereddict import OrderedDict
+import threading
+import weakref
+
+from fiona.crs import from_epsg, from_string
+import pyproj
+
+# Maximum number of (source, target) projection pairs kept by
+# get_projections
+PROJ_CACHE_SIZE = 128
+
+try:
+    string_types = basestring
+except NameError:
+    string_types = str
+
+
+def _canonical_value(key, value):
+    if isinstance(value, string_types):
+        value = value.strip()
+        if key == 'init':
+            return value.lower()
+        return value
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+def _key_value(value):
+    """Return a parameter value as compared in crs_key"""
+    if isinstance(value, string_types):
+        try:
+            return float(value)
+        except ValueError:
+            return value
+    return value
+
+
+def _parse(crs):
+    """Return the proj4 parameters of a crs as a dict"""
+    if isinstance(crs, dict):
+        return crs
+    if isinstance(crs, string_types):
+        crs = crs.strip()
+        if not crs.startswith('+') and ':' in crs and ' ' not in crs:
+            # an authority code such as 'epsg:4326'
+            return {'init': crs}
+        return from_string(crs)
+    if isinstance(crs, int) and not isinstance(crs, bool):
+        return from_epsg(crs)
+    raise TypeError('Cannot make a CRS from {0!r}'.format(crs))
+
+
+def _canonical(crs):
+    """Return the canonical proj4 parameters of a crs as a dict"""
+    return dict((key.lstrip('+').lower(),
+                 _canonical_value(key.lstrip('+').lower(), value))
+                for key, value in _parse(crs).items())
+
+
+def _params_key(params):
+    return tuple(sorted((key, _key_value(value))
+                        for key, value in params.items()))
+
+
+def crs_key(crs):
+    """
+    Return a hashable, normalized form of a crs
+
+    Dicts of proj4 parameters are turned into sorted tuples of their
+    canonical items, so equal crs give the same key whatever the order
+    or spelling of their parameters: keys lose their '+', EPSG codes
+    ('init') are lower cased and numbers given as strings are compared
+    as numbers.  Proj4 strings and EPSG codes (ints) are parsed first.
+    """
+    if isinstance(crs, CRS):
+        return crs._key
+    return _params_key(_canonical(crs))
+
+
+class CRS(dict):
+    """
+    An immutable coordinate reference system.
+
+    A CRS is a dict of canonical proj4 parameters (see crs_key), so it
+    can be passed to fiona and encoded as JSON like the crs dicts fiona
+    returns, and it compares equal to any dict of the same system.  It
+    doesn't compare equal to proj4 strings, whose hash differs; use
+    CRS(string) to compare with one.  Identical systems share a single
+    instance and the hash is computed once, so comparisons between CRS
+    objects are cheap.
+
+    Parameters
+    ----------
+    crs : CRS, dict, proj4 string or int (EPSG code)
+    """
+
+    _interned = weakref.WeakValueDictionary()
+    _lock = threading.Lock()
+
+    def __new__(cls, crs):
+        if isinstance(crs, CRS):
+            return crs
+        params = _canonical(crs)
+        key = _params_key(params)
+        with cls._lock:
+            self = cls._interned.get(key)
+            if self is None:
+                self = dict.__new__(cls)
+                dict.update(self, params)
+                self._key = key
+                self._hash = hash(key)
+                cls._interned[key] = self
+        return self
+
+    def __init__(self, crs):
+        # everything is set up in __new__
+        pass
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if isinstance(other, CRS):
+            return self._key == other._key
+        if isinstance(other, dict):
+            try:
+                return self._key == crs_key(other)
+            except (TypeError, ValueError):
+                return False
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    def __repr__(self):
+        return 'CRS({0})'.format(dict.__repr__(self))
+
+    def __reduce__(self):
+        return CRS, (dict(self),)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError('CRS objects are immutable')
+
+    __setitem__ = __delitem__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def to_dict(self):
+        """Return the parameters as a plain dict, as fiona uses"""
+        return dict(self)
+
+
+def as_crs(crs):
+    """Return *crs* as a CRS, or None if it is None"""
+    if crs is None:
+        return None
+    return CRS(crs)
+
+
+class _LRUCache(object):
+    """A thread-safe mapping keeping the *maxsize* last used items"""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._items.pop(key)
+            except KeyError:
+                return default
+            self._items[key] = value
+            return value
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._items.pop(key, None)
+            self._items[key] = value
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
+_projections = _LRUCache(PROJ_CACHE_SIZE)
+
+
+def get_projections(crs_in, crs_out):
+    """
+    Return the pyproj.Proj objects of a source and a target crs
+
+    The pairs are cached by their CRS, keeping the PROJ_CACHE_SIZE last
+    used pairs, so transforming between the same crs again doesn't set up
+    the projections again.
+    """
+    key = (CRS(crs_in), CRS(crs_out))
+    projections = _projections.get(key)
+    if projections is None:
+        projections = tuple(pyproj.Proj(preserve_units=True, **crs)
+                            for crs in key)
+        _projections[key] = projections
+    return projections
@@ -9,15 +9,17 @@ import sys
 
 import fiona
 import numpy as np
-from pandas import DataFrame, Series
-from shapely.geometry import mapping
+from pandas import DataFrame, Series, isnull
 
 from geopandas import GeoSeries
+from geopandas.crs import as_crs
 from geopandas.plotting import plot_dataframe
 import geopandas.io
 
 
 DEFAULT_GEO_COLUMN_NAME = 'geometry'
+# Number of features handed to fiona at a time by to_file
+WRITE_CHUNKSIZE = 10000
 PY3 = sys.version[0] == 3
 
 
@@ -29,8 +31,8 @@ class GeoDataFrame(DataFrame):
 
     Keyword Arguments
     -----------------
-    crs : str (optional)
-        Coordinate system
+    crs : str, dict or CRS (optional)
+        Coordinate system, stored as a geopandas.crs.CRS
     geometry : str or array (optional)
         If str, column to use as geometry. If array, will be set as 'geometry'
         column on GeoDataFrame.
@@ -70,6 +72,17 @@ class GeoDataFrame(DataFrame):
     geometry = property(fget=_get_geometry, fset=_set_geometry,
                         doc="Geometry data for GeoDataFrame")
 
+    _crs = None
+
+    def _get_crs(self):
+        return self._crs
+
+    def _set_crs(self, crs):
+        object.__setattr__(self, '_crs', as_crs(crs))
+
+    crs = property(fget=_get_crs, fset=_set_crs,
+                   doc="Coordinate system as a geopandas.crs.CRS (or None)")
+
     def set_geometry(self, col, drop=False, inplace=False, crs=None):
         """
         Set the GeoDataFrame geometry using either an existing column or
@@ -131,11 +144,17 @@ class GeoDataFrame(DataFrame):
         if to_remove:
             del frame[to_remove]
 
-        if isinstance(level, GeoSeries) and level.crs != crs:
+        if isinstance(level, GeoSeries) and level.crs != as_crs(crs):
             # avoids caching issues/crs sharing issues
             level = level.copy()
             level.crs = crs
 
+        if geo_column_name in frame:
+            # the column may be overwritten in place, so drop data cached
+            # from the old geometries
+            old = frame[geo_column_name]
+            if isinstance(old, GeoSeries):
+                old._invalidate_cache()
         frame[geo_column_name] = level
         frame._geometry_column_name = geo_column_name
         frame.crs = crs
@@ -174,7 +193,8 @@ class GeoDataFrame(DataFrame):
                      coerce_float, params)
 
 
-    def to_json(self, na='null', **kwargs):
+    def to_json(self, na='null', path_or_buf=None, chunksize=None,
+                **kwargs):
         """Returns a GeoJSON representation of the GeoDataFrame.
 
         Parameters
@@ -186,45 +206,87 @@ class GeoDataFrame(DataFrame):
                     each feature individually so that features may have
                     different properties
             * keep: output the missing entries as NaN
+        path_or_buf : string or file handle (optional)
+            If given, the GeoJSON is written to this file in chunks and
+            nothing is returned.
+        chunksize : int (optional)
+            Number of features encoded at a time, defaults to
+            WRITE_CHUNKSIZE.
         
         The remaining *kwargs* are passed to json.dumps().
         """
-        def fill_none(row):
-            """
-            Takes in a Series, converts to a dictionary with null values
-            set to None
-
-            """
-            na_keys = row.index[row.isnull()]
-            d = row.to_dict()
-            for k in na_keys:
-                d[k] = None
-            return d
-
-        # na_methods must take in a Series and return dict-like
-        na_methods = {'null': fill_none,
-                      'drop': lambda row: row.dropna(),
-                      'keep': lambda row: row}
-
-        if na not in na_methods:
+        chunks = self.iter_geojson(na=na, chunksize=chunksize, **kwargs)
+        if path_or_buf is None:
+            return ''.join(chunks)
+        if hasattr(path_or_buf, 'write'):
+            for chunk in chunks:
+                path_or_buf.write(chunk)
+        else:
+            with open(path_or_buf, 'w') as f:
+                for chunk in chunks:
+                    f.write(chunk)
+
+    def iter_geojson(self, na='null', chunksize=None, **kwargs):
+        """
+        Generate the GeoJSON FeatureCollection of the GeoDataFrame as
+        pieces of text that concatenate to the output of to_json.
+
+        Only *chunksize* features are held in memory at a time, so large
+        frames can be streamed to a file or a response.  See to_json for
+        the parameters.
+        """
+        if na not in ('null', 'drop', 'keep'):
             raise ValueError('Unknown na method {}'.format(na))
-        f = na_methods[na]
-
-        def feature(i, row):
-            row = f(row)
-            return {
-                'id': str(i),
-                'type': 'Feature',
-                'properties':
-                    dict((k, v) for k, v in row.iteritems() if k != 'geometry'),
-                'geometry': mapping(row['geometry']) }
-
-        return json.dumps(
-            {'type': 'FeatureCollection',
-             'features': [feature(i, row) for i, row in self.iterrows()]},
-            **kwargs )
-            
-    def to_file(self, filename, driver="ESRI Shapefile", **kwargs):
+        names = [col for col in self.columns if col != 'geometry']
+        return self._iter_geojson(self._iter_records(names, chunksize, na),
+                                  **kwargs)
+
+    def to_geojsonseq(self, path_or_buf, na='null', chunksize=None,
+                      mode='w', **kwargs):
+        """
+        Write the GeoDataFrame as newline-delimited GeoJSON (GeoJSONSeq),
+        one feature per line.
+
+        Parameters
+        ----------
+        path_or_buf : string or file handle
+        na : {'null', 'drop', 'keep'}, default 'null'
+            How to output missing values, see to_json.
+        chunksize : int (optional)
+            Number of features encoded at a time, defaults to
+            WRITE_CHUNKSIZE.
+        mode : str, default 'w'
+            Mode in which a path is opened, use 'a' to append features to
+            an existing file.
+
+        The remaining *kwargs* are passed to json.dumps(); they must not
+        introduce newlines (e.g. indent).
+        """
+        if na not in ('null', 'drop', 'keep'):
+            raise ValueError('Unknown na method {0}'.format(na))
+        names = [col for col in self.columns if col != 'geometry']
+        if not hasattr(path_or_buf, 'write'):
+            with open(path_or_buf, mode) as f:
+                return self.to_geojsonseq(f, na, chunksize, **kwargs)
+        for _, records in self._iter_records(names, chunksize, na):
+            path_or_buf.write(''.join(json.dumps(rec, **kwargs) + '\n'
+                                      for rec in records))
+
+    @staticmethod
+    def _iter_geojson(chunks, **kwargs):
+        separator = kwargs.get('separators', (', ', ': '))[0]
+        yield '{"type": "FeatureCollection", "features": ['
+        first = True
+        for _, records in chunks:
+            if not first:
+                yield separator
+            # strip the brackets of the encoded list of features
+            yield json.dumps(records, **kwargs)[1:-1]
+            first = False
+        yield ']}'
+
+    def to_file(self, filename, driver="ESRI Shapefile", chunksize=None,
+                progress=None, **kwargs):
         """
         Write this GeoDataFrame to an OGR data source
         
@@ -238,6 +300,11 @@ class GeoDataFrame(DataFrame):
             File path or file handle to write to.
         driver : string, default 'ESRI Shapefile'
             The OGR format driver used to write the vector file.
+        chunksize : int (optional)
+            Number of features converted and written at a time, defaults
+            to WRITE_CHUNKSIZE.
+        progress : callable (optional)
+            Called as ``progress(written, total)`` after each chunk.
 
         The *kwargs* are passed to fiona.open and can be used to write 
         to multi-layer data, store data within archives (zip files), etc.
@@ -247,14 +314,6 @@ class GeoDataFrame(DataFrame):
                 return 'str'
             return type(np.asscalar(np.zeros(1, in_type))).__name__
             
-        def feature(i, row):
-            return {
-                'id': str(i),
-                'type': 'Feature',
-                'properties':
-                    dict((k, v) for k, v in row.iteritems() if k != 'geometry'),
-                'geometry': mapping(row['geometry']) }
-        
         properties = OrderedDict([(col, convert_type(_type)) for col, _type 
             in zip(self.columns, self.dtypes) if col!='geometry'])
         # Need to check geom_types before we write to file... 
@@ -270,10 +329,74 @@ class GeoDataFrame(DataFrame):
         filename = os.path.abspath(os.path.expanduser(filename))
         with fiona.open(filename, 'w', driver=driver, crs=self.crs, 
                         schema=schema, **kwargs) as c:
-            for i, row in self.iterrows():
-                c.write(feature(i, row))
+            for written, records in self._iter_records(list(properties),
+                                                       chunksize):
+                c.writerecords(records)
+                if progress is not None:
+                    progress(written, len(self))
+
+    def to_postgis(self, name, con, if_exists='fail', chunksize=None,
+                   schema=None):
+        """
+        Write this GeoDataFrame to a PostGIS table, copying the rows in
+        chunks with COPY ... FROM STDIN.
+
+        Wraps geopandas.io.sql.to_postgis(), see there for the
+        parameters.
+        """
+        geopandas.io.sql.to_postgis(self, name, con, if_exists, chunksize,
+                                    schema)
+
+    def to_parquet(self, path, row_group_size=None, compression='snappy'):
+        """
+        Write this GeoDataFrame to a Parquet file, with the geometries
+        encoded as WKB.  Requires pyarrow.
+
+        Wraps geopandas.io.parquet.to_parquet(), see there for the
+        parameters.  Read the file back with geopandas.read_parquet().
+        """
+        geopandas.io.parquet.to_parquet(self, path, row_group_size,
+                                        compression)
 
-    def to_crs(self, crs=None, epsg=None, inplace=False):
+    def _iter_records(self, names, chunksize=None, na='keep'):
+        """
+        Generate (number of rows done, list of GeoJSON-like features) for
+        chunks of *chunksize* rows.
+
+        Each property column is converted to Python scalars once per chunk
+        instead of once per row; *na* is handled as in to_json.
+        """
+        if chunksize is None:
+            chunksize = WRITE_CHUNKSIZE
+        if chunksize < 1:
+            raise ValueError('chunksize must be a positive integer')
+        columns = [self[name].values for name in names]
+        stop = 0
+        for geoms in self['geometry']._iter_mappings(chunksize):
+            start, stop = stop, stop + len(geoms)
+            values = [col[start:stop].tolist() for col in columns]
+            nulls = []
+            if na != 'keep':
+                nulls = [(name, np.nonzero(isnull(col[start:stop]))[0])
+                         for name, col in zip(names, columns)]
+            if na == 'null':
+                for col_values, (_, missing) in zip(values, nulls):
+                    for i in missing:
+                        col_values[i] = None
+            rows = zip(*values) if values else [()] * (stop - start)
+            records = [{'id': str(i),
+                        'type': 'Feature',
+                        'properties': dict(zip(names, row)),
+                        'geometry': geom}
+                       for i, row, geom in zip(self.index[start:stop], rows,
+                                               geoms)]
+            if na == 'drop':
+                for name, missing in nulls:
+                    for i in missing:
+                        del records[i]['properties'][name]
+            yield stop, records
+
+    def to_crs(self, crs=None, epsg=None, inplace=False, n_jobs=None):
         """Transform geometries to a new coordinate reference system
 
         This method will transform all points in all objects.  It has
@@ -281,12 +404,15 @@ class GeoDataFrame(DataFrame):
         joining points are assumed to be lines in the current
         projection, not geodesics.  Objects crossing the dateline (or
         other projection boundary) will have undesirable behavior.
+
+        *n_jobs* sets the number of workers, if geopandas.options.engine
+        is 'threads' or 'processes'.
         """
         if inplace:
             df = self
         else:
             df = self.copy()
-        geom = df.geometry.to_crs(crs=crs, epsg=epsg)
+        geom = df.geometry.to_crs(crs=crs, epsg=epsg, n_jobs=n_jobs)
         df.geometry = geom
         df.crs = geom.crs
         if not inplace:
@@ -1,4 +1,6 @@
+import binascii
 from functools import partial
+import operator
 from warnings import warn
 
 import fiona
@@ -6,20 +8,60 @@ from fiona.crs import from_epsg
 import numpy as np
 from pandas import Series, DataFrame
 import pyproj
-from shapely.geometry import shape, Polygon, Point
+from shapely.geometry import mapping, shape, Polygon, Point
 from shapely.geometry.collection import GeometryCollection
-from shapely.geometry.base import BaseGeometry
+from shapely.geometry.base import BaseGeometry, geom_factory
+from shapely.geos import lgeos
 from shapely.ops import cascaded_union, unary_union, transform
+from shapely.prepared import prep, PreparedGeometry
 import shapely.affinity as affinity
 
+from geopandas.crs import as_crs, get_projections
+from geopandas.packed import PackedGeometry
+from geopandas.parallel import (call_binary, call_method, get_attribute,
+                                map_chunks, map_rows, options, unpack)
 from geopandas.plotting import plot_series
+from geopandas.sindex import SpatialIndex
 
 OLD_PANDAS = issubclass(Series, np.ndarray)
 
+try:
+    string_types = basestring
+except NameError:
+    string_types = str
+
+try:
+    memoryview_types = (memoryview,)
+except NameError:  # Python 2.6 only has buffer, which bytes() copies
+    memoryview_types = ()
+
+# Number of geometries measured at once by geodesic_area and
+# geodesic_length, which bounds the size of their temporary arrays
+GEODESIC_CHUNKSIZE = 100000
+
 EMPTY_COLLECTION = GeometryCollection()
 EMPTY_POLYGON = Polygon()
 EMPTY_POINT = Point()
 
+# Predicates that are always False for geometries with disjoint envelopes
+_ENVELOPE_PREDICATES = frozenset(['contains', 'crosses', 'equals',
+                                  'intersects', 'overlaps', 'touches',
+                                  'within'])
+# a.op(b) is b.converse(a)
+_CONVERSE_PREDICATES = {'contains': 'within', 'crosses': 'crosses',
+                        'disjoint': 'disjoint', 'intersects': 'intersects',
+                        'overlaps': 'overlaps', 'touches': 'touches',
+                        'within': 'contains'}
+# Predicates available on shapely prepared geometries (only contains and
+# intersects before Shapely 1.3)
+_PREPARED_PREDICATES = frozenset(op for op in _CONVERSE_PREDICATES
+                                 if hasattr(PreparedGeometry, op))
+# Predicates whose converse GEOS speeds up when the other geometry is
+# prepared
+_PREPARE_OTHER = frozenset(
+    op for op in ['disjoint', 'intersects', 'within']
+    if _CONVERSE_PREDICATES[op] in _PREPARED_PREDICATES)
+
 
 def _is_empty(x):
     try:
@@ -27,6 +69,87 @@ def _is_empty(x):
     except:
         return False
 
+def _bounds_array(geoms):
+    """Return an (N, 4) array of minx, miny, maxx, maxy for each geometry
+
+    The bounds are written into a preallocated array in a single pass.
+    Empty or missing geometries get NaN bounds.
+    """
+    bounds = np.empty((len(geoms), 4), dtype=np.float64)
+    for i, geom in enumerate(geoms):
+        b = getattr(geom, 'bounds', None)
+        bounds[i] = b if b else np.nan
+    return bounds
+
+def _is_hex(value):
+    """Return True if a WKB value is hex encoded rather than binary"""
+    if isinstance(value, bytes):
+        # binary WKB starts with the byte order flag 0 or 1
+        return value[:1] not in (b'\x00', b'\x01')
+    return isinstance(value, string_types)
+
+
+def _wkb_loads(values):
+    """Return a list of geometries from WKB values (None for missing)
+
+    Values may be hex strings, as PostGIS returns geometry columns, or
+    binary WKB (bytes, buffer, memoryview), as ST_AsBinary and bytea
+    columns give.  The hex values are decoded in one call and a single
+    GEOS reader parses all the values.
+    """
+    values = list(values)
+    wkb = [None] * len(values)
+    hex_positions = []
+    for i, value in enumerate(values):
+        if value is None or value != value:  # None or NaN
+            continue
+        if _is_hex(value):
+            hex_positions.append(i)
+        elif isinstance(value, memoryview_types):
+            wkb[i] = value.tobytes()
+        else:
+            wkb[i] = bytes(value)
+    if hex_positions:
+        hexes = [values[i] for i in hex_positions]
+        data = binascii.unhexlify(''.join(
+            h.decode('ascii') if isinstance(h, bytes) else h
+            for h in hexes))
+        start = 0
+        for i, h in zip(hex_positions, hexes):
+            stop = start + len(h) // 2
+            wkb[i] = data[start:stop]
+            start = stop
+
+    reader = lgeos.GEOSWKBReader_create()
+    read = lgeos.GEOSWKBReader_read
+    geoms = []
+    try:
+        for i, data in enumerate(wkb):
+            if data is None:
+                geoms.append(None)
+                continue
+            geom = read(reader, data, len(data))
+            if not geom:
+                raise ValueError('Could not read the WKB at position {0}'
+                                 .format(i))
+            geoms.append(geom_factory(geom))
+    finally:
+        lgeos.GEOSWKBReader_destroy(reader)
+    return geoms
+
+def _transform(geoms, crs_in, crs_out):
+    """Transform a sequence of geometries from crs_in to crs_out"""
+    proj_in, proj_out = get_projections(crs_in, crs_out)
+    project = partial(pyproj.transform, proj_in, proj_out)
+    return [transform(project, geom) for geom in geoms]
+
+def _transform_coords(coords, crs_in, crs_out):
+    """Transform an (N, 2) or (N, 3) coordinate array with one pyproj call"""
+    proj_in, proj_out = get_projections(crs_in, crs_out)
+    columns = [np.ascontiguousarray(coords[:, i])
+               for i in range(coords.shape[1])]
+    return np.column_stack(pyproj.transform(proj_in, proj_out, *columns))
+
 def _convert_array_args(args):
     if len(args) == 1 and isinstance(args[0], BaseGeometry):
         args = ([args[0]],)
@@ -35,6 +158,9 @@ def _convert_array_args(args):
 class GeoSeries(Series):
     """A Series object designed to store shapely geometry objects."""
     _metadata = ['name', 'crs']
+    # Data derived from the geometries (packed coordinates, bounds), kept
+    # until the geometries are modified.  See _get_cached().
+    _cache = None
 
     def __new__(cls, *args, **kwargs):
         if OLD_PANDAS:
@@ -55,6 +181,17 @@ class GeoSeries(Series):
         super(GeoSeries, self).__init__(*args, **kwargs)
         self.crs = crs
 
+    _crs = None
+
+    def _get_crs(self):
+        return self._crs
+
+    def _set_crs(self, crs):
+        object.__setattr__(self, '_crs', as_crs(crs))
+
+    crs = property(fget=_get_crs, fset=_set_crs,
+                   doc="Coordinate system as a geopandas.crs.CRS (or None)")
+
     @classmethod
     def from_file(cls, filename, **kwargs):
         """
@@ -71,18 +208,98 @@ class GeoSeries(Series):
         kwargs : key-word arguments
             These arguments are passed to fiona.open, and can be used to 
             access multi-layer data, data stored within archives (zip files),
-            etc.
+            etc.  The bbox, rows and max_features keywords select the
+            features to read, as for geopandas.read_file.
         
         """
+        from geopandas.io.file import _records
+        selection = dict((key, kwargs.pop(key, None)) for key in
+                         ['bbox', 'rows', 'max_features'])
         geoms = []
         with fiona.open(filename, **kwargs) as f:
             crs = f.crs
-            for rec in f:
+            for rec in _records(f, **selection):
                 geoms.append(shape(rec['geometry']))
         g = GeoSeries(geoms)
         g.crs = crs
         return g
 
+    @classmethod
+    def from_wkb(cls, values, index=None, crs=None):
+        """
+        Alternate constructor to create a GeoSeries from WKB
+
+        Parameters
+        ----------
+        values : sequence of hex strings or binary WKB
+            Hex encoded (as PostGIS returns geometries) or binary WKB
+            (bytes, buffer or memoryview).  EWKB with an SRID is accepted.
+            None and NaN give missing geometries.
+        index : array-like or Index (optional)
+        crs : str or dict (optional)
+            Coordinate system
+        """
+        return GeoSeries(_wkb_loads(values), index=index, crs=crs)
+
+    @classmethod
+    def from_packed(cls, packed, index=None, crs=None):
+        """
+        Alternate constructor to create a GeoSeries from a PackedGeometry
+
+        The packed buffers are kept with the GeoSeries and used for
+        vectorized operations (area, length, bounds).
+
+        Parameters
+        ----------
+        packed : PackedGeometry
+        index : array-like or Index (optional)
+        crs : str or dict (optional)
+            Coordinate system
+        """
+        g = GeoSeries(packed.to_shapely(), index=index, crs=crs)
+        g._set_cached('packed', packed)
+        return g
+
+    def to_packed(self):
+        """
+        Return the geometries as a PackedGeometry of coordinate arrays
+
+        The result is kept with the GeoSeries until it is modified, so
+        later vectorized operations can reuse it.
+        """
+        packed = self._get_cached('packed')
+        if packed is None:
+            packed = PackedGeometry.from_shapely(self.values)
+            self._set_cached('packed', packed)
+        return packed
+
+    def to_native(self, path):
+        """
+        Write the geometries to the directory *path* in the native format
+        of geopandas.io.native, which can be memory-mapped when loaded.
+        """
+        from geopandas.io.native import to_native
+        to_native(self, path)
+
+    def _iter_mappings(self, chunksize):
+        """
+        Generate lists of GeoJSON-like geometry dicts (None for missing
+        geometries) for chunks of *chunksize* geometries.
+
+        If the coordinates are already packed (see to_packed), the dicts
+        are built straight from the coordinate arrays, which is much faster
+        than shapely.geometry.mapping.  Packing only for this is slower
+        than calling mapping, so it isn't done here.
+        """
+        packed = self._get_cached('packed')
+        for start in range(0, len(self), chunksize):
+            stop = min(start + chunksize, len(self))
+            if packed is not None:
+                yield packed.take(slice(start, stop)).to_geojson()
+            else:
+                yield [mapping(g) if isinstance(g, BaseGeometry) else None
+                       for g in self.values[start:stop]]
+
     def to_file(self, filename, driver="ESRI Shapefile", **kwargs):
         from geopandas import GeoDataFrame
         data = GeoDataFrame({"geometry": self,
@@ -101,10 +318,13 @@ class GeoSeries(Series):
             if self.crs != other.crs:
                 warn('GeoSeries crs mismatch: {0} and {1}'.format(self.crs, other.crs))
             this, other = self.align(other)
-            return GeoSeries([getattr(s[0], op)(s[1]) for s in zip(this, other)],
+            return GeoSeries(map_chunks(partial(call_binary, op=op),
+                                        this.values, other.values),
                           index=this.index, crs=self.crs)
         else:
-            return GeoSeries([getattr(s, op)(other) for s in self],
+            return GeoSeries(map_chunks(partial(call_method, op=op,
+                                                args=(other,)),
+                                        self.values),
                           index=self.index, crs=self.crs)
 
     # TODO: think about merging with _geo_op
@@ -114,13 +334,87 @@ class GeoSeries(Series):
             this, other = self.align(other)
             return Series([getattr(s[0], op)(s[1], **kwargs) for s in zip(this, other)],
                           index=this.index)
+        elif op in _ENVELOPE_PREDICATES or op == 'disjoint':
+            # only test the rows whose envelopes intersect other's
+            result = np.empty(len(self), dtype=bool)
+            result.fill(op == 'disjoint')
+            candidates = self.sindex.query(other)
+            if op == 'equals' and _is_empty(other):
+                # empty geometries have no envelope, but equal each other
+                candidates = self._empty_positions()
+            if len(candidates):
+                test = self._row_predicate(op, other, **kwargs)
+                result[candidates] = [test(i) for i in candidates]
+            return Series(result, index=self.index)
         else:
             return Series([getattr(s, op)(other, **kwargs) for s in self],
                           index=self.index)
 
+    def _predicate_pairs(self, other, op):
+        """
+        Return the positions (i, j) of all pairs for which
+        ``self[i].op(other[j])`` is True
+
+        Candidates are found with the spatial index of *other*, so op
+        must be False for geometries with disjoint envelopes, except that
+        empty geometries are tested against each other for 'equals'.
+        """
+        if op not in _ENVELOPE_PREDICATES:
+            raise ValueError('Unsupported spatial predicate {0}'.format(op))
+        this_idx, other_idx = other.sindex.query_bulk(self._bounds_array())
+        if op == 'equals':
+            # empty geometries have no envelope, but equal each other
+            this_empty = self._empty_positions()
+            other_empty = other._empty_positions()
+            this_idx = np.concatenate(
+                [this_idx, np.repeat(this_empty, len(other_empty))])
+            other_idx = np.concatenate(
+                [other_idx, np.tile(other_empty, len(this_empty))])
+        this_prepared = self._get_cached('prepared')
+        other_prepared = other._get_cached('prepared')
+        this, other = self.values, other.values
+        if this_prepared is not None and op in _PREPARED_PREDICATES:
+            match = [getattr(this_prepared[i], op)(other[j])
+                     for i, j in zip(this_idx, other_idx)]
+        elif (other_prepared is not None and
+              _CONVERSE_PREDICATES.get(op) in _PREPARED_PREDICATES):
+            converse = _CONVERSE_PREDICATES[op]
+            match = [getattr(other_prepared[j], converse)(this[i])
+                     for i, j in zip(this_idx, other_idx)]
+        else:
+            match = [getattr(this[i], op)(other[j])
+                     for i, j in zip(this_idx, other_idx)]
+        match = np.array(match, dtype=bool)
+        return this_idx[match], other_idx[match]
+
+    def _empty_positions(self):
+        """Return the positions of the empty (not missing) geometries"""
+        values = self.values
+        nan = np.isnan(self._bounds_array()).any(axis=1)
+        return np.array([i for i in np.flatnonzero(nan)
+                         if isinstance(values[i], BaseGeometry)],
+                        dtype=np.int64)
+
+    def _row_predicate(self, op, other, **kwargs):
+        """
+        Return a function of a position i that tests
+        ``self.values[i].op(other)``, using prepared geometries when
+        possible
+        """
+        prepared = self._get_cached('prepared')
+        if prepared is not None and op in _PREPARED_PREDICATES and not kwargs:
+            return lambda i: getattr(prepared[i], op)(other)
+        values = self.values
+        if op in _PREPARE_OTHER and not kwargs:
+            # prepare other once instead of testing it against every row
+            converse = getattr(prep(other), _CONVERSE_PREDICATES[op])
+            return lambda i: converse(values[i])
+        return lambda i: getattr(values[i], op)(other, **kwargs)
+
     def _geo_unary_op(self, op):
         """Unary operation that returns a GeoSeries"""
-        return GeoSeries([getattr(geom, op) for geom in self],
+        return GeoSeries(map_chunks(partial(get_attribute, op=op),
+                                    self.values),
                          index=self.index, crs=self.crs)
 
     def _series_unary_op(self, op):
@@ -128,6 +422,79 @@ class GeoSeries(Series):
         return Series([getattr(geom, op) for geom in self],
                          index=self.index)
 
+    def _bounds_array(self):
+        """Return the bounds of each geometry as a read-only (N, 4) array
+
+        The array is cached until the GeoSeries is modified.
+        """
+        bounds = self._get_cached('bounds')
+        if bounds is None:
+            packed = self._get_cached('packed')
+            if packed is not None:
+                bounds = packed.bounds()
+            else:
+                bounds = _bounds_array(self.values)
+            self._set_cached('bounds', bounds)
+        return bounds
+
+    @property
+    def sindex(self):
+        """Spatial index over the bounds of the geometries
+
+        The index is built on first use and kept until the GeoSeries is
+        modified.  See geopandas.sindex.SpatialIndex.
+        """
+        sindex = self._get_cached('sindex')
+        if sindex is None:
+            sindex = SpatialIndex(self._bounds_array())
+            self._set_cached('sindex', sindex)
+        return sindex
+
+    def prepare(self):
+        """
+        Prepare each geometry for fast repeated predicate tests
+
+        The prepared geometries are kept until the GeoSeries is modified.
+        They are used when contains, intersects, within, touches, crosses,
+        overlaps or disjoint is called with a single geometry, and by
+        predicate_matrix and sjoin.  Before Shapely 1.3 only contains and
+        intersects can use them.
+
+        Returns
+        -------
+        self
+        """
+        if self._get_cached('prepared') is None:
+            prepared = np.empty(len(self), dtype=object)
+            for i, geom in enumerate(self.values):
+                if isinstance(geom, BaseGeometry) and not geom.is_empty:
+                    prepared[i] = prep(geom)
+            self._set_cached('prepared', prepared)
+        return self
+
+    def _get_cached(self, key):
+        """Return cached derived data, or None if it isn't cached"""
+        if self._cache is None:
+            return None
+        return self._cache.get(key)
+
+    def _set_cached(self, key, value):
+        if self._cache is None:
+            object.__setattr__(self, '_cache', {})
+        if isinstance(value, np.ndarray):
+            value.flags.writeable = False
+        self._cache[key] = value
+
+    def _invalidate_cache(self):
+        """Drop cached derived data after the geometries have changed"""
+        object.__setattr__(self, '_cache', None)
+
+    def _take_cache(self, other, positions):
+        """Copy the cached data of the rows at *positions* of *other*"""
+        for key, value in (other._cache or {}).items():
+            if isinstance(value, (np.ndarray, PackedGeometry)):
+                self._set_cached(key, value[positions])
+
     #
     # Implementation of Shapely methods
     #
@@ -139,6 +506,9 @@ class GeoSeries(Series):
     @property
     def area(self):
         """Return the area of each geometry in the GeoSeries"""
+        packed = self._get_cached('packed')
+        if packed is not None:
+            return Series(packed.area(), index=self.index)
         return self._series_unary_op('area')
 
     @property
@@ -154,6 +524,9 @@ class GeoSeries(Series):
     @property
     def length(self):
         """Return the length of each geometry in the GeoSeries"""
+        packed = self._get_cached('packed')
+        if packed is not None:
+            return Series(packed.length(), index=self.index)
         return self._series_unary_op('length')
 
     @property
@@ -299,6 +672,30 @@ class GeoSeries(Series):
         """Return True for all geometries that are within *other*, else False"""
         return self._series_op(other, 'within')
 
+    def predicate_matrix(self, other, op='intersects'):
+        """
+        Return a sparse boolean matrix of *op* between all pairs of
+        geometries
+
+        Entry (i, j) is True if ``self.iloc[i].op(other.iloc[j])``.  Only
+        pairs with overlapping envelopes are tested.  Requires scipy.
+
+        Parameters
+        ----------
+        other : GeoSeries
+        op : {'intersects', 'contains', 'within', 'touches', 'crosses',
+              'overlaps', 'equals'}, default 'intersects'
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix of shape (len(self), len(other))
+        """
+        from scipy import sparse
+        rows, cols = self._predicate_pairs(other, op)
+        return sparse.csr_matrix(
+            (np.ones(len(rows), dtype=bool), (rows, cols)),
+            shape=(len(self), len(other)))
+
     def distance(self, other):
         """Return distance of each geometry to *other*"""
         return self._series_op(other, 'distance')
@@ -310,8 +707,7 @@ class GeoSeries(Series):
     @property
     def bounds(self):
         """Return a DataFrame of minx, miny, maxx, maxy values of geometry objects"""
-        bounds = np.array([geom.bounds for geom in self])
-        return DataFrame(bounds,
+        return DataFrame(self._bounds_array().copy(),
                          columns=['minx', 'miny', 'maxx', 'maxy'],
                          index=self.index)
 
@@ -321,19 +717,42 @@ class GeoSeries(Series):
 
         This is a shortcut for calculating the min/max x and y bounds individually.
         """
+        packed = self._get_cached('packed')
+        if packed is not None and self._get_cached('bounds') is None:
+            return packed.total_bounds()
+        b = self._bounds_array()
+        mins = np.nanmin(b[:, :2], axis=0)
+        maxs = np.nanmax(b[:, 2:], axis=0)
+        return (mins[0], mins[1], maxs[0], maxs[1])
+
+    def buffer(self, distance, resolution=16, n_jobs=None):
+        """
+        Return a GeoSeries of geometries buffered by *distance*
 
-        b = self.bounds
-        return (b['minx'].min(),
-                b['miny'].min(),
-                b['maxx'].max(),
-                b['maxy'].max())
-
-    def buffer(self, distance, resolution=16):
-        return GeoSeries([geom.buffer(distance, resolution) for geom in self],
+        Parameters
+        ----------
+        distance : float
+        resolution : int, default 16
+            Number of segments used to approximate a quarter circle
+        n_jobs : int (optional)
+            Number of workers, if geopandas.options.engine is 'threads'
+            or 'processes'.  Defaults to geopandas.options.n_jobs.
+        """
+        func = partial(call_method, op='buffer', args=(distance, resolution))
+        return GeoSeries(map_chunks(func, self.values, n_jobs=n_jobs),
                          index=self.index, crs=self.crs)
 
     def simplify(self, *args, **kwargs):
-        return GeoSeries([geom.simplify(*args, **kwargs) for geom in self],
+        """
+        Return a GeoSeries of simplified geometries
+
+        The arguments are passed to shapely's simplify (tolerance,
+        preserve_topology).  The *n_jobs* keyword sets the number of
+        workers, as for buffer().
+        """
+        n_jobs = kwargs.pop('n_jobs', None)
+        func = partial(call_method, op='simplify', args=args, kwargs=kwargs)
+        return GeoSeries(map_chunks(func, self.values, n_jobs=n_jobs),
                       index=self.index, crs=self.crs)
 
     def relate(self, other):
@@ -514,7 +933,23 @@ class GeoSeries(Series):
         return val
 
     def __getitem__(self, key):
-        return self._wrapped_pandas_method('__getitem__', key)
+        result = self._wrapped_pandas_method('__getitem__', key)
+        if (isinstance(result, GeoSeries) and self._cache and
+                result._cache is None and self.index.is_unique):
+            # rows are only subset, so the cached data can be subset too
+            positions = self.index.get_indexer(result.index)
+            if (positions >= 0).all():
+                result._take_cache(self, positions)
+        return result
+
+    def __setitem__(self, key, value):
+        super(GeoSeries, self).__setitem__(key, value)
+        self._invalidate_cache()
+
+    def _maybe_update_cacher(self, *args, **kwargs):
+        # called by pandas after setting values through .loc/.iloc
+        super(GeoSeries, self)._maybe_update_cacher(*args, **kwargs)
+        self._invalidate_cache()
 
     def __getslice__(self, i, j):
         return self._wrapped_pandas_method('__getslice__', i, j)
@@ -525,8 +960,11 @@ class GeoSeries(Series):
     def sort_index(self, *args, **kwargs):
         return self._wrapped_pandas_method('sort_index', *args, **kwargs)
 
-    def take(self, *args, **kwargs):
-        return self._wrapped_pandas_method('take', *args, **kwargs)
+    def take(self, indices, *args, **kwargs):
+        result = self._wrapped_pandas_method('take', indices, *args, **kwargs)
+        if isinstance(result, GeoSeries) and self._cache:
+            result._take_cache(self, np.asarray(indices))
+        return result
 
     def select(self, *args, **kwargs):
         return self._wrapped_pandas_method('select', *args, **kwargs)
@@ -556,8 +994,12 @@ class GeoSeries(Series):
         copy : GeoSeries
         """
         # FIXME: this will likely be unnecessary in pandas >= 0.13
-        return GeoSeries(self.values.copy(order), index=self.index,
-                      name=self.name).__finalize__(self)
+        result = GeoSeries(self.values.copy(order), index=self.index,
+                           name=self.name).__finalize__(self)
+        # the copy holds the same geometries, so the derived data is valid
+        if self._cache:
+            object.__setattr__(result, '_cache', dict(self._cache))
+        return result
 
     def isnull(self):
         """Null values in a GeoSeries are represented by empty geometric objects"""
@@ -572,8 +1014,11 @@ class GeoSeries(Series):
         "method" is currently not implemented for pandas <= 0.12.
         """
         if not OLD_PANDAS:
-            return super(GeoSeries, self).fillna(value=value, method=method,
-                                                 inplace=inplace, **kwargs)
+            result = super(GeoSeries, self).fillna(value=value, method=method,
+                                                   inplace=inplace, **kwargs)
+            if inplace:
+                self._invalidate_cache()
+            return result
         else:
             # FIXME: this is an ugly way to support pandas <= 0.12
             if method is not None:
@@ -605,7 +1050,54 @@ class GeoSeries(Series):
     # Additional methods
     #
 
-    def to_crs(self, crs=None, epsg=None):
+    def geodesic_area(self, ellps='WGS84'):
+        """
+        Return the area of each geometry bounded by the geodesics of an
+        ellipsoid, in square meters
+
+        The coordinates must be longitudes and latitudes in degrees; the
+        areas are computed from packed coordinates (see to_packed), without
+        projecting the geometries.  *ellps* is the name of a
+        pyproj ellipsoid.  See PackedGeometry.geodesic_area.
+        """
+        return self._geodesic_op('geodesic_area', ellps)
+
+    def geodesic_length(self, ellps='WGS84'):
+        """
+        Return the length (or perimeter) of each geometry along the
+        geodesics of an ellipsoid, in meters
+
+        The coordinates must be longitudes and latitudes in degrees.
+        *ellps* is the name of a pyproj ellipsoid.
+        """
+        return self._geodesic_op('geodesic_length', ellps)
+
+    def _geodesic_op(self, op, ellps):
+        """Apply a geodesic PackedGeometry measure in chunks of geometries"""
+        if self.crs is not None:
+            proj = get_projections(self.crs, self.crs)[0]
+            if not proj.is_latlong():
+                raise ValueError('Geodesic measures need longitude/latitude '
+                                 'coordinates, use to_crs first.')
+        geod = pyproj.Geod(ellps=ellps)
+        packed = self._get_cached('packed')
+        if packed is not None and len(packed) <= GEODESIC_CHUNKSIZE:
+            values = getattr(packed, op)(geod)
+        else:
+            values = np.empty(len(self), dtype=np.float64)
+            for start in range(0, len(self), GEODESIC_CHUNKSIZE):
+                stop = start + GEODESIC_CHUNKSIZE
+                if packed is not None:
+                    chunk = packed[start:stop]
+                else:
+                    # packed chunks aren't cached, so the series doesn't
+                    # keep a second copy of its coordinates
+                    chunk = PackedGeometry.from_shapely(
+                        self.values[start:stop])
+                values[start:stop] = getattr(chunk, op)(geod)
+        return Series(values, index=self.index)
+
+    def to_crs(self, crs=None, epsg=None, n_jobs=None):
         """Transform geometries to a new coordinate reference system
 
         This method will transform all points in all objects.  It has
@@ -613,6 +1105,16 @@ class GeoSeries(Series):
         joining points are assumed to be lines in the current
         projection, not geodesics.  Objects crossing the dateline (or
         other projection boundary) will have undesirable behavior.
+
+        The coordinates of all geometries are packed and transformed with
+        one pyproj call per chunk of the coordinate buffer.  The packed
+        copy is only kept with the result if this series keeps one (see
+        to_packed).  If geopandas.options.engine is 'threads' or 'processes'
+        the chunks are transformed on *n_jobs* workers; worker processes
+        transform their chunks in place in shared memory (see
+        parallel.map_rows).  Threads also rebuild the geometries, while
+        with processes they are rebuilt here from the shared buffer, so no
+        coordinates or geometries are pickled.
         """
         if self.crs is None:
             raise ValueError('Cannot transform naive geometries.  '
@@ -622,10 +1124,29 @@ class GeoSeries(Series):
                 crs = from_epsg(epsg)
             except TypeError:
                 raise TypeError('Must set either crs or epsg for output.')
-        proj_in = pyproj.Proj(preserve_units=True, **self.crs)
-        proj_out = pyproj.Proj(preserve_units=True, **crs)
-        project = partial(pyproj.transform, proj_in, proj_out)
-        result = self.apply(lambda geom: transform(project, geom))
-        result.__class__ = GeoSeries
-        result.crs = crs
+        # a packed copy is only kept if to_packed was called, as it holds
+        # every coordinate a second time
+        packed = self._get_cached('packed')
+        keep_packed = packed is not None
+        if packed is None:
+            try:
+                packed = PackedGeometry.from_shapely(self.values)
+            except (TypeError, ValueError):
+                # geometries that can't be packed are transformed one by one
+                func = partial(_transform, crs_in=self.crs, crs_out=crs)
+                return GeoSeries(map_chunks(func, self.values,
+                                            n_jobs=n_jobs),
+                                 index=self.index, name=self.name, crs=crs)
+        # the coordinate buffer is transformed in chunks, then the
+        # geometries are rebuilt from the new buffer
+        func = partial(_transform_coords, crs_in=self.crs, crs_out=crs)
+        packed = packed.with_coords(map_rows(func, packed.coords,
+                                             n_jobs=n_jobs))
+        if options.engine == 'processes':
+            geoms = unpack(packed)
+        else:
+            geoms = map_chunks(unpack, packed, n_jobs=n_jobs)
+        result = GeoSeries(geoms, index=self.index, name=self.name, crs=crs)
+        if keep_packed:
+            result._set_cached('packed', packed)
         return result
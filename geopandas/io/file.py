@@ -1,10 +1,25 @@
-from collections import defaultdict
+from distutils.version import LooseVersion
+from functools import partial
+from itertools import islice
+import json
 
+import numpy as np
+from pandas import DataFrame, to_datetime
 from shapely.geometry import shape
 import fiona
 
 from geopandas import GeoSeries, GeoDataFrame
 
+# fiona >= 1.8 can skip fields and geometries while reading from OGR
+FIONA_IGNORE_FIELDS = LooseVersion(fiona.__version__) >= LooseVersion('1.8')
+# Initial number of rows allocated for each column when the number of
+# records isn't known in advance
+INITIAL_CAPACITY = 1024
+# dtype of the column allocated for each fiona field type, other types
+# (str, time, ...) are stored as objects
+FIELD_DTYPES = {'int': np.int64, 'float': np.float64, 'bool': np.bool_}
+
+
 def read_file(filename, **kwargs):
     """
     Returns a GeoDataFrame from a file.
@@ -13,26 +28,252 @@ def read_file(filename, **kwargs):
     opened and *kwargs* are keyword args to be passed to the method when
     opening the file.
 
-    Note: This method does not attempt to align rows.
-    Properties that are not present in all features of the source
-    file will not be properly aligned.  This should be fixed.
+    Besides the fiona.open arguments, these keywords are accepted:
+
+    bbox : tuple (minx, miny, maxx, maxy) (optional)
+        Only read the features intersecting the box.
+    columns : list of str (optional)
+        Only read these properties.
+    ignore_geometry : bool, default False
+        Don't read the geometries and return a pandas DataFrame of the
+        properties only.
+    rows : int or slice (optional)
+        Only read the features at these positions (the first *rows*
+        features if an int).
+    max_features : int (optional)
+        Stop after reading this many features.
+    chunksize : int (optional)
+        If given, return an iterator of GeoDataFrames with at most
+        *chunksize* rows each, instead of a single GeoDataFrame.  Only one
+        chunk is held in memory at a time.  Every chunk has the crs of the
+        file and the index continues from the previous chunk.
+
+    The columns are typed from the schema of the layer: int, float and
+    bool fields give numeric or bool columns, date and datetime fields
+    give datetime64 columns and other fields give object columns.
+    Properties missing from a feature are NaN (NaT for dates), which
+    turns int and bool columns with missing values into float and object
+    columns.
+    """
+    opts = dict((key, kwargs.pop(key, None)) for key in
+                ['bbox', 'columns', 'rows', 'max_features'])
+    opts['ignore_geometry'] = kwargs.pop('ignore_geometry', False)
+    chunksize = kwargs.pop('chunksize', None)
+    if chunksize is not None:
+        _check_chunksize(chunksize)
+        return _read_file_chunks(filename, chunksize, opts, kwargs)
+    with _open(filename, opts, kwargs) as f:
+        return _records_to_df(_records(f, **opts), f.crs, f.schema, **opts)
+
+
+def _read_file_chunks(filename, chunksize, opts, kwargs):
+    """Generate GeoDataFrames of *chunksize* records of the file"""
+    with _open(filename, opts, kwargs) as f:
+        to_df = partial(_records_to_df, crs=f.crs, schema=f.schema, **opts)
+        for df in _iter_chunks(_records(f, **opts), chunksize, to_df):
+            yield df
+
+
+def _check_chunksize(chunksize):
+    """Raise a ValueError unless *chunksize* is a positive integer"""
+    if chunksize < 1:
+        raise ValueError('chunksize must be a positive integer')
+
+
+def _iter_chunks(items, chunksize, to_df):
+    """
+    Generate the GeoDataFrames returned by *to_df* for each list of
+    *chunksize* items, with an index continuing across the chunks
     """
+    start = 0
+    while True:
+        chunk = list(islice(items, chunksize))
+        if not chunk:
+            break
+        df = to_df(chunk)
+        df.index = df.index + start
+        start += len(chunk)
+        yield df
+
+
+def _open(filename, opts, kwargs):
+    """
+    Open a fiona collection, checking the requested columns and telling
+    fiona to skip the unused fields when it can
+    """
+    columns = opts['columns']
+    if columns is not None:
+        with fiona.open(filename, **kwargs) as f:
+            names = list(f.schema['properties'])
+        missing = [col for col in columns if col not in names]
+        if missing:
+            raise ValueError('Unknown columns: {0}'.format(missing))
+        if FIONA_IGNORE_FIELDS:
+            kwargs['ignore_fields'] = [n for n in names if n not in columns]
+    if opts['ignore_geometry'] and FIONA_IGNORE_FIELDS:
+        kwargs['ignore_geometry'] = True
+    return fiona.open(filename, **kwargs)
+
+
+def _records(f, bbox=None, rows=None, max_features=None, **kwargs):
+    """Iterate over the selected records of an open fiona collection"""
+    if bbox != None:
+        assert len(bbox)==4
+    if rows is not None:
+        if not isinstance(rows, slice):
+            rows = slice(rows)
+        records = f.filter(rows.start, rows.stop, rows.step, bbox=bbox)
+    elif bbox is not None:
+        records = f.filter(bbox=bbox)
+    else:
+        records = iter(f)
+    if max_features is not None:
+        records = islice(records, max_features)
+    return records
+
+
+def _field_type(ftype):
+    """Return the base type of a fiona field type such as 'int:10'"""
+    return ftype.split(':')[0]
+
+
+def _grow(values, size):
+    """Return a copy of *values* with room for *size* rows"""
+    grown = np.empty(size, dtype=values.dtype)
+    grown[:len(values)] = values
+    return grown
+
+
+def _finish_column(values, missing, ftype):
+    """Fill the missing values of a column, converting its dtype if needed"""
+    if ftype in ('date', 'datetime'):
+        values[missing] = None
+        return to_datetime(values)
+    if not missing.any():
+        return values
+    if ftype == 'int':
+        values = values.astype(np.float64)
+    elif ftype == 'bool':
+        values = values.astype(object)
+    values[missing] = np.nan
+    return values
+
+
+def _records_to_df(records, crs, schema, columns=None, ignore_geometry=False,
+                   **kwargs):
+    """
+    Build a GeoDataFrame from an iterable of fiona records
+
+    The property columns are preallocated with the dtypes of the fields in
+    *schema* and filled by position, so features without some properties
+    stay aligned.
+    """
+    fields = schema['properties']
+    names = list(fields) if columns is None else list(columns)
+    types = [_field_type(fields[name]) for name in names]
+    size = len(records) if hasattr(records, '__len__') else INITIAL_CAPACITY
+    values = [np.empty(size, dtype=FIELD_DTYPES.get(ftype, object))
+              for ftype in types]
+    missing = [np.empty(size, dtype=bool) for name in names]
     geoms = []
-    columns = defaultdict(lambda: [])
-    bbox = kwargs.pop('bbox', None)
-    with fiona.open(filename, **kwargs) as f:
-        crs = f.crs
-        if bbox != None:
-            assert len(bbox)==4
-            f_filt = f.filter(bbox=bbox)
-        else:
-            f_filt = f
-        for rec in f_filt:
+    n = 0
+    for rec in records:
+        if n == size:
+            size *= 2
+            values = [_grow(col, size) for col in values]
+            missing = [_grow(col, size) for col in missing]
+        if not ignore_geometry:
             geoms.append(shape(rec['geometry']))
-            for key, value in rec['properties'].iteritems():
-                columns[key].append(value)
+        properties = rec['properties']
+        for name, col, col_missing in zip(names, values, missing):
+            value = properties.get(name)
+            col_missing[n] = value is None
+            if value is not None:
+                col[n] = value
+        n += 1
+    data = dict((name, _finish_column(col[:n], col_missing[:n], ftype))
+                for name, col, col_missing, ftype
+                in zip(names, values, missing, types))
+    if ignore_geometry:
+        return DataFrame(data, columns=names)
     geom = GeoSeries(geoms)
-    df = GeoDataFrame(columns)
+    df = GeoDataFrame(data, columns=names)
     df['geometry'] = geom
     df.crs = crs
     return df
+
+
+def read_geojsonseq(filename, chunksize=None, byte_range=None, crs=None):
+    """
+    Returns a GeoDataFrame from a newline-delimited GeoJSON file
+    (GeoJSONSeq), with one feature per line.
+
+    Parameters
+    ----------
+    filename : str
+        Path to the file.
+    chunksize : int (optional)
+        If given, return an iterator of GeoDataFrames with at most
+        *chunksize* rows each, instead of a single GeoDataFrame.
+    byte_range : tuple (start, stop) (optional)
+        Only read the features whose line starts at a byte offset in
+        [start, stop).  Ranges that split the file, for example
+        ``(i * size // n, (i + 1) * size // n)`` for ``i in range(n)``
+        where size is the file size, read every feature exactly once and
+        can be read by separate processes.
+    crs : dict (optional)
+        Coordinate system of the GeoDataFrame, defaults to WGS84 as the
+        GeoJSON specification requires.
+
+    Properties are aligned by name; properties missing from a feature are
+    NaN.  Blank lines and the record separators of RFC 8142 are skipped.
+    """
+    if crs is None:
+        crs = {'init': 'epsg:4326'}
+    if chunksize is not None:
+        _check_chunksize(chunksize)
+        return _read_geojsonseq_chunks(filename, chunksize, byte_range, crs)
+    with open(filename, 'rb') as f:
+        return _features_to_df(list(_iter_lines(f, byte_range)), crs)
+
+
+def _read_geojsonseq_chunks(filename, chunksize, byte_range, crs):
+    """Generate GeoDataFrames of *chunksize* features of the file"""
+    with open(filename, 'rb') as f:
+        to_df = partial(_features_to_df, crs=crs)
+        for df in _iter_chunks(_iter_lines(f, byte_range), chunksize, to_df):
+            yield df
+
+
+def _iter_lines(f, byte_range=None):
+    """
+    Iterate over the non-blank lines of a file opened in binary mode
+    which start in *byte_range*
+    """
+    if byte_range is None:
+        start, stop = 0, None
+    else:
+        start, stop = byte_range
+    if start > 0:
+        # skip the line that started before the range; if the previous
+        # byte is a newline this only skips that newline
+        f.seek(start - 1)
+        f.readline()
+    while stop is None or f.tell() < stop:
+        line = f.readline()
+        if not line:
+            break
+        line = line.decode('utf-8').strip().lstrip(u'\x1e')
+        if line:
+            yield line
+
+
+def _features_to_df(lines, crs):
+    """Build a GeoDataFrame from a list of GeoJSON features encoded as text"""
+    features = [json.loads(line) for line in lines]
+    geoms = [shape(feat['geometry']) if feat.get('geometry') else None
+             for feat in features]
+    df = GeoDataFrame([feat.get('properties') or {} for feat in features])
+    df['geometry'] = GeoSeries(geoms)
+    df.crs = crs
+    return df
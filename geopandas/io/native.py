@@ -0,0 +1,146 @@
+"""
+Native on-disk format for geometries: the buffers of a PackedGeometry
+written as flat binary files, which are memory-mapped when loaded.
+
+A dataset is a directory with one raw little-endian file per buffer and
+a small JSON header::
+
+    path/header.json
+    path/coords.bin
+    path/ring_offsets.bin
+    path/part_offsets.bin
+    path/geom_offsets.bin
+    path/types.bin
+    path/index.npy         (only if the index isn't 0 .. n - 1)
+
+The index is stored as a typed array, so it is loaded without unpickling;
+an index of strings is kept as a fixed-width unicode array.
+
+Opening a dataset only maps the files, so it takes the same time for any
+size and the pages are read (and shared between processes) when they are
+touched.  Attributes can be stored next to the geometries in any columnar
+format, e.g. with GeoDataFrame.to_parquet.
+"""
+import json
+import os
+
+import numpy as np
+from pandas import Index
+
+from geopandas import GeoSeries
+from geopandas.geoseries import string_types
+from geopandas.packed import PackedGeometry
+
+FORMAT_VERSION = 1
+HEADER = 'header.json'
+INDEX = 'index.npy'
+# dtype of each buffer on disk
+BUFFERS = [('coords', '<f8'), ('ring_offsets', '<i8'),
+           ('part_offsets', '<i8'), ('geom_offsets', '<i8'), ('types', 'i1')]
+
+
+def to_native(s, path):
+    """
+    Write the geometries of a GeoSeries to the directory *path*.
+
+    The directory is created if needed and existing files of a dataset
+    are overwritten.  The crs, name and index of the series are kept;
+    the index must hold numbers, datetimes or strings.
+    """
+    packed = s.to_packed()
+    if not os.path.isdir(path):
+        os.makedirs(path)
+    for name, dtype in BUFFERS:
+        values = np.ascontiguousarray(getattr(packed, name), dtype=dtype)
+        values.tofile(os.path.join(path, name + '.bin'))
+    default_index = s.index.equals(Index(np.arange(len(s))))
+    index_dtype = None
+    if not default_index:
+        index = s.index.values
+        if index.dtype == object:
+            if not all(isinstance(v, string_types) for v in index):
+                raise TypeError('Only numeric, datetime or string indexes '
+                                'can be written')
+            index = index.astype('U')
+            index_dtype = 'object'
+        np.save(os.path.join(path, INDEX), index, allow_pickle=False)
+    elif os.path.exists(os.path.join(path, INDEX)):
+        os.remove(os.path.join(path, INDEX))
+    header = {'version': FORMAT_VERSION,
+              'length': len(packed),
+              'ndim': packed.ndim,
+              'crs': s.crs,
+              'name': s.name,
+              'index_name': s.index.name,
+              'index_dtype': index_dtype}
+    with open(os.path.join(path, HEADER), 'w') as f:
+        json.dump(header, f)
+
+
+def _read_header(path):
+    with open(os.path.join(path, HEADER)) as f:
+        header = json.load(f)
+    if header['version'] != FORMAT_VERSION:
+        raise ValueError('Unsupported native format version {0}'.format(
+            header['version']))
+    return header
+
+
+def _map(filename, dtype, mmap_mode):
+    """Memory-map a buffer; numpy can't map empty files"""
+    if not os.path.getsize(filename):
+        return np.empty(0, dtype=dtype)
+    return np.memmap(filename, dtype=dtype, mode=mmap_mode)
+
+
+def open_native(path, mmap_mode='r'):
+    """
+    Return the geometries of a dataset as a PackedGeometry whose buffers
+    are memory-mapped, without reading the files.
+
+    The vectorized PackedGeometry methods (bounds, area, length, take,
+    ...) work on the mapped buffers directly.  *mmap_mode* is passed to
+    numpy.memmap; 'r' shares the pages between processes.
+    """
+    header = _read_header(path)
+    buffers = dict((name, _map(os.path.join(path, name + '.bin'), dtype,
+                               mmap_mode))
+                   for name, dtype in BUFFERS)
+    buffers['coords'] = buffers['coords'].reshape(-1, header['ndim'])
+    return PackedGeometry(**buffers)
+
+
+def read_native(path, rows=None, mmap_mode='r'):
+    """
+    Returns a GeoSeries from a dataset written by to_native.
+
+    Parameters
+    ----------
+    path : str
+        Directory of the dataset.
+    rows : int positions, slice or boolean mask (optional)
+        Only build these geometries.  Only the pages holding their
+        coordinates are read from disk.
+    mmap_mode : str, default 'r'
+        Passed to numpy.memmap.
+
+    The returned GeoSeries keeps the PackedGeometry of its rows (see
+    GeoSeries.to_packed), so vectorized operations don't pack it again.
+    """
+    header = _read_header(path)
+    packed = open_native(path, mmap_mode)
+    index_file = os.path.join(path, INDEX)
+    if os.path.exists(index_file):
+        index = np.load(index_file, allow_pickle=False)
+        if header.get('index_dtype') == 'object':
+            index = index.astype(object)
+    else:
+        index = np.arange(len(packed))
+    if rows is not None:
+        packed = packed.take(rows)
+        index = index[rows]
+    s = GeoSeries.from_packed(packed, index=Index(index,
+                                                  name=header['index_name']),
+                              crs=header['crs'])
+    s.name = header['name']
+    return s
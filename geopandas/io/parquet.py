@@ -0,0 +1,175 @@
+import json
+
+import numpy as np
+from pandas import DataFrame, Index, isnull
+from shapely.geometry.base import BaseGeometry
+
+from geopandas import GeoSeries, GeoDataFrame
+
+# Default number of rows in each row group written by to_parquet
+ROW_GROUP_SIZE = 100000
+# Key of the geopandas metadata in the schema of the Parquet file
+METADATA_KEY = b'geopandas'
+INDEX_COLUMN = '__index__'
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError('pyarrow is required for Parquet support')
+    return pyarrow
+
+
+def _arrow_type(values, pa):
+    """Return the arrow type of a whole column, with NaN and None as nulls"""
+    if values.dtype == object:
+        return pa.infer_type(values, from_pandas=True)
+    return pa.from_numpy_dtype(values.dtype)
+
+
+def _to_arrow(values, pa, type=None):
+    """Return an arrow array of a column, with NaN and None as nulls"""
+    if values.dtype == object:
+        values = values.copy()
+        values[isnull(values)] = None
+    return pa.array(values, type=type, from_pandas=True)
+
+
+def _to_numpy(column):
+    """Return the values of an arrow column as a numpy array"""
+    if not column.num_chunks:
+        return np.empty(0, dtype=column.type.to_pandas_dtype())
+    values = np.concatenate([chunk.to_numpy(zero_copy_only=False)
+                             for chunk in column.chunks])
+    if values.dtype == object:
+        values[isnull(values)] = np.nan
+    return values
+
+
+def to_parquet(df, path, row_group_size=None, compression='snappy'):
+    """
+    Write a GeoDataFrame to a Parquet file, with the geometries as WKB.
+
+    The crs, the name of the geometry column, the index and the bounds of
+    each row group are stored in the metadata of the file, so read_parquet
+    can skip row groups outside of a bounding box.  Requires pyarrow.
+
+    Parameters
+    ----------
+    df : GeoDataFrame
+    path : str
+    row_group_size : int (optional)
+        Number of rows in each row group, defaults to ROW_GROUP_SIZE.
+    compression : str, default 'snappy'
+        Compression codec, see pyarrow.parquet.write_table.
+    """
+    pa = _import_pyarrow()
+    if row_group_size is None:
+        row_group_size = ROW_GROUP_SIZE
+    if row_group_size < 1:
+        raise ValueError('row_group_size must be a positive integer')
+    geom_col = df._geometry_column_name
+    geoms = df.geometry
+    bounds = geoms._bounds_array()
+    starts = list(range(0, len(df), row_group_size)) or [0]
+    group_bounds = []
+    for start in starts:
+        box = bounds[start:start + row_group_size]
+        box = box[~np.isnan(box).any(axis=1)]
+        if len(box):
+            group_bounds.append(box[:, :2].min(axis=0).tolist() +
+                                box[:, 2:].max(axis=0).tolist())
+        else:
+            group_bounds.append(None)
+    metadata = {'crs': df.crs,
+                'geometry_column': geom_col,
+                'index_name': df.index.name,
+                'row_group_bounds': group_bounds}
+
+    names = [col for col in df.columns if col != geom_col]
+    columns = [df.index.values] + [df[col].values for col in names]
+    # Infer the types from the whole columns, so a row group where a column
+    # is all missing doesn't get a different schema than the others
+    types = [_arrow_type(col, pa) for col in columns]
+    wkb = [g.wkb if isinstance(g, BaseGeometry) else None
+           for g in geoms.values]
+    writer = None
+    try:
+        for start in starts:
+            stop = start + row_group_size
+            arrays = [_to_arrow(col[start:stop], pa, type=t)
+                      for col, t in zip(columns, types)]
+            arrays.append(pa.array(wkb[start:stop], type=pa.binary()))
+            table = pa.Table.from_arrays(
+                arrays, names=[INDEX_COLUMN] + [str(n) for n in names] +
+                [str(geom_col)])
+            if writer is None:
+                table = table.replace_schema_metadata(
+                    {METADATA_KEY: json.dumps(metadata).encode('utf-8')})
+                writer = pa.parquet.ParquetWriter(path, table.schema,
+                                                  compression=compression)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def read_parquet(path, columns=None, row_groups=None, bbox=None):
+    """
+    Returns a GeoDataFrame from a Parquet file written by to_parquet.
+
+    Parameters
+    ----------
+    path : str
+    columns : list of str (optional)
+        Only read these columns; the geometry column is always read.
+    row_groups : list of int (optional)
+        Only read these row groups.
+    bbox : tuple (minx, miny, maxx, maxy) (optional)
+        Only read the rows whose geometry bounds intersect the box.  Row
+        groups whose bounds don't intersect the box aren't read at all.
+
+    Requires pyarrow.
+    """
+    pa = _import_pyarrow()
+    f = pa.parquet.ParquetFile(path)
+    metadata = json.loads(f.metadata.metadata[METADATA_KEY].decode('utf-8'))
+    geom_col = metadata['geometry_column']
+    if row_groups is None:
+        row_groups = range(f.num_row_groups)
+    if bbox is not None:
+        group_bounds = metadata['row_group_bounds']
+        row_groups = [i for i in row_groups if group_bounds[i] is not None
+                      and group_bounds[i][0] <= bbox[2]
+                      and group_bounds[i][2] >= bbox[0]
+                      and group_bounds[i][1] <= bbox[3]
+                      and group_bounds[i][3] >= bbox[1]]
+    names = [name for name in f.schema.names
+             if name not in (INDEX_COLUMN, geom_col)]
+    if columns is not None:
+        # the geometry and the index are always read
+        columns = [col for col in columns if col not in (INDEX_COLUMN,
+                                                         geom_col)]
+        missing = [col for col in columns if col not in names]
+        if missing:
+            raise ValueError('Unknown columns: {0}'.format(missing))
+        names = [name for name in names if name in columns]
+    table = f.read_row_groups(list(row_groups),
+                              columns=[INDEX_COLUMN] + names + [geom_col])
+
+    index = Index(_to_numpy(table.column(INDEX_COLUMN)),
+                  name=metadata['index_name'])
+    geoms = GeoSeries.from_wkb(table.column(geom_col).to_pylist(),
+                               index=index)
+    data = dict((name, _to_numpy(table.column(name))) for name in names)
+    df = GeoDataFrame(DataFrame(data, columns=names, index=index))
+    df[geom_col] = geoms
+    df = df.set_geometry(geom_col)
+    df.crs = metadata['crs']
+    if bbox is not None:
+        bounds = df.geometry._bounds_array()
+        df = df[(bounds[:, 0] <= bbox[2]) & (bounds[:, 2] >= bbox[0]) &
+                (bounds[:, 1] <= bbox[3]) & (bounds[:, 3] >= bbox[1])]
+    return df
@@ -1,11 +1,23 @@
-from pandas import read_sql
-import shapely.wkb
+import binascii
+from io import BytesIO
+import struct
+import uuid
+
+import numpy as np
+from pandas import DataFrame, Timestamp, read_sql
+from shapely.geometry.base import BaseGeometry
 
 
 from geopandas import GeoSeries, GeoDataFrame
+from geopandas.geoseries import string_types
+from geopandas.io.file import _check_chunksize
+
+# Flag of the geometry type in EWKB telling that an SRID follows
+EWKB_SRID_FLAG = 0x20000000
 
 def read_postgis(sql, con, geom_col='geom', crs=None, index_col=None,
-                 coerce_float=True, params=None):
+                 coerce_float=True, params=None, chunksize=None, bbox=None,
+                 mask=None, columns=None):
     """
     Returns a GeoDataFrame corresponding to the result of the query 
     string, which must contain a geometry column.
@@ -19,24 +31,306 @@ def read_postgis(sql, con, geom_col='geom', crs=None, index_col=None,
     sql: string
     con: DB connection object
     geom_col: string, default 'geom'
-        column name to convert to shapely geometries
+        column name to convert to shapely geometries.  The column may hold
+        hex encoded WKB (as PostGIS returns geometry columns) or binary
+        WKB (e.g. from ST_AsBinary)
     crs: optional
         CRS to use for the returned GeoDataFrame
+    chunksize: int, optional
+        If given, return an iterator of GeoDataFrames with at most
+        *chunksize* rows each.  The rows are fetched from a named (server
+        side) cursor, so only one chunk is held in memory.  With psycopg2
+        the connection must not be in autocommit mode.  Without index_col
+        the index continues from the previous chunk.
+    bbox: tuple (minx, miny, maxx, maxy), optional
+        Only return the rows whose geometry bounding box intersects the
+        box.  The filter (``&& ST_MakeEnvelope(...)``) is run by the
+        database, so it can use a spatial index on geom_col, which must
+        be a PostGIS geometry column.  The box is in the SRID of the EPSG
+        code of crs, or else in the SRID of the geometries of the query.
+    mask: shapely geometry, optional
+        Like bbox, but only return the rows whose geometry intersects
+        *mask* (ST_Intersects).  Can't be combined with bbox.
+    columns: list of strings, optional
+        Only select these columns of the query (the geometry column and
+        index_col are always selected).
 
     See the documentation for pandas.read_sql for further explanation 
     of the following parameters:
     index_col, coerce_float, params
 
     """
+    if bbox is not None or mask is not None or columns is not None:
+        sql, params = _filter_query(sql, con, geom_col, crs, index_col,
+                                    params, bbox, mask, columns)
+    if chunksize is not None:
+        _check_chunksize(chunksize)
+        return _read_postgis_chunks(sql, con, geom_col, crs, index_col,
+                                    coerce_float, params, chunksize)
     df = read_sql(sql, con, index_col, coerce_float, params)
+    return _to_geodataframe(df, geom_col, crs)
+
+
+def _add_params(params, values):
+    """
+    Return the query parameters with *values* appended, and the
+    placeholders of the new values
+    """
+    if isinstance(params, dict):
+        params = dict(params)
+        placeholders = []
+        for i, value in enumerate(values):
+            key = '_geopandas_{0}'.format(i)
+            params[key] = value
+            placeholders.append('%({0})s'.format(key))
+        return params, placeholders
+    return list(params or []) + list(values), ['%s'] * len(values)
+
+
+def _filter_query(sql, con, geom_col, crs, index_col, params, bbox, mask,
+                  columns):
+    """
+    Wrap a query in a select of *columns* whose geometries intersect
+    *bbox* or *mask*.  Returns the new query and parameters.
+    """
+    if bbox is not None and mask is not None:
+        raise ValueError('bbox and mask can not be combined')
+    sql = sql.strip().rstrip(';')
+    if columns is None:
+        select = 'q.*'
+    else:
+        keep = list(columns)
+        for col in [index_col, geom_col]:
+            if col is not None and col not in keep:
+                keep.append(col)
+        select = ', '.join('q.{0}'.format(_quote(col)) for col in keep)
+    query = 'SELECT {0} FROM ({1}) AS q'.format(select, sql)
+    if bbox is None and mask is None:
+        return query, params
+
+    srid = _srid(crs)
+    if not srid:
+        # the envelope must have the SRID of the geometries
+        cursor = con.cursor()
+        try:
+            srid_sql = 'SELECT ST_SRID(q.{0}) FROM ({1}) AS q LIMIT 1'.format(
+                _quote(geom_col), sql)
+            if params is None:
+                cursor.execute(srid_sql)
+            else:
+                cursor.execute(srid_sql, params)
+            row = cursor.fetchone()
+        finally:
+            cursor.close()
+        srid = row[0] if row else 0
+    if params is None:
+        # the query is now formatted with parameters
+        query = query.replace('%', '%%')
+    if mask is not None:
+        params, (wkb, srid_param) = _add_params(params,
+                                                [mask.wkb_hex, srid])
+        condition = ("ST_Intersects(q.{0}, ST_GeomFromWKB(decode({1}, 'hex'), "
+                     "{2}))").format(_quote(geom_col), wkb, srid_param)
+    else:
+        params, placeholders = _add_params(params, list(bbox) + [srid])
+        condition = 'q.{0} && ST_MakeEnvelope({1})'.format(
+            _quote(geom_col), ', '.join(placeholders))
+    return '{0} WHERE {1}'.format(query, condition), params
+
+
+def _to_geodataframe(df, geom_col, crs):
+    """Decode the WKB geometry column of a query result"""
     if geom_col not in df:
-        raise ValueError("Query missing geometry column '{}'".format(
+        raise ValueError("Query missing geometry column '{0}'".format(
             geom_col))
 
-    wkb_geoms = df[geom_col]
+    df[geom_col] = GeoSeries.from_wkb(df[geom_col].values, index=df.index)
 
-    s = wkb_geoms.apply(lambda x: shapely.wkb.loads(x.decode('hex')))
+    return GeoDataFrame(df, crs=crs, geometry=geom_col)
 
-    df[geom_col] = GeoSeries(s)
 
-    return GeoDataFrame(df, crs=crs, geometry=geom_col)
+def _cursor(con):
+    """
+    Return a named (server side) cursor if the driver supports them, as
+    psycopg2 does, or else a regular cursor
+    """
+    try:
+        return con.cursor(name='geopandas_{0}'.format(uuid.uuid4().hex))
+    except TypeError:
+        return con.cursor()
+
+
+def _read_postgis_chunks(sql, con, geom_col, crs, index_col, coerce_float,
+                         params, chunksize):
+    """Generate GeoDataFrames of *chunksize* rows of the query result"""
+    cursor = _cursor(con)
+    try:
+        if params is None:
+            cursor.execute(sql)
+        else:
+            cursor.execute(sql, params)
+        start = 0
+        while True:
+            rows = cursor.fetchmany(chunksize)
+            if not rows:
+                break
+            # named cursors only describe the result after a fetch
+            columns = [desc[0] for desc in cursor.description]
+            df = DataFrame.from_records(rows, columns=columns,
+                                        coerce_float=coerce_float)
+            if index_col is not None:
+                df = df.set_index(index_col)
+            else:
+                df.index = df.index + start
+            start += len(rows)
+            yield _to_geodataframe(df, geom_col, crs)
+    finally:
+        cursor.close()
+
+
+# SQL types of the columns created by to_postgis, by numpy dtype kind
+SQL_TYPES = {'i': 'bigint', 'u': 'bigint', 'f': 'double precision',
+             'b': 'boolean', 'M': 'timestamp'}
+# Number of rows sent in each COPY by to_postgis
+COPY_CHUNKSIZE = 10000
+
+
+def _srid(crs):
+    """Return the EPSG code of a crs such as {'init': 'epsg:4326'}, or 0"""
+    if isinstance(crs, dict):
+        crs = crs.get('init', '')
+    crs = (crs or '').lower().replace('+init=', '')
+    if crs.startswith('epsg:'):
+        try:
+            return int(crs[5:])
+        except ValueError:
+            pass
+    return 0
+
+
+def _ewkb_hex(geom, srid):
+    """Return the hex EWKB of a geometry, with *srid* in the header"""
+    wkb = geom.wkb
+    if not srid:
+        return binascii.hexlify(wkb).decode('ascii')
+    order = '<' if wkb[:1] == b'\x01' else '>'
+    geom_type = struct.unpack(order + 'I', wkb[1:5])[0]
+    header = wkb[:1] + struct.pack(order + 'II', geom_type | EWKB_SRID_FLAG,
+                                   srid)
+    return binascii.hexlify(header + wkb[5:]).decode('ascii')
+
+
+def _quote(name):
+    return '"{0}"'.format(name.replace('"', '""'))
+
+
+def _copy_value(value):
+    """Return a value in the text format of COPY"""
+    if value is None or value != value:  # None or NaN
+        return '\\N'
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if isinstance(value, float):
+        return repr(value)
+    if not isinstance(value, string_types):
+        value = str(value)
+    return (value.replace('\\', '\\\\').replace('\t', '\\t')
+            .replace('\n', '\\n').replace('\r', '\\r'))
+
+
+def _copy_text(columns, start, stop):
+    """Return the COPY text (UTF-8) of rows start:stop of the column arrays"""
+    values = []
+    for col in columns:
+        if col.dtype.kind == 'M':
+            values.append([str(Timestamp(v)) if v == v else None
+                           for v in col[start:stop]])
+        else:
+            values.append(col[start:stop].tolist())
+    text = ''.join('\t'.join(_copy_value(v) for v in row) + '\n'
+                   for row in zip(*values))
+    if not isinstance(text, bytes):
+        text = text.encode('utf-8')
+    return text
+
+
+def to_postgis(df, name, con, if_exists='fail', chunksize=None,
+               schema=None):
+    """
+    Write a GeoDataFrame to a PostGIS table with COPY.
+
+    The geometries are sent as hex EWKB with the SRID of the crs (EPSG
+    codes only, else 0) and the rows are copied in chunks, so no SQL
+    statement is run per row.  The index isn't written.  Requires a
+    psycopg2 connection; the transaction is committed at the end, or
+    rolled back if writing fails.
+
+    Parameters
+    ----------
+    df : GeoDataFrame
+    name : str
+        Name of the table.
+    con : psycopg2 connection
+    if_exists : {'fail', 'replace', 'append'}, default 'fail'
+        * fail: raise a ValueError if the table exists
+        * replace: drop the table and create it again
+        * append: insert the rows into the existing table
+    chunksize : int (optional)
+        Number of rows per COPY, defaults to COPY_CHUNKSIZE.
+    schema : str (optional)
+        Schema of the table, defaults to the current schema.
+    """
+    if if_exists not in ('fail', 'replace', 'append'):
+        raise ValueError("'{0}' is not valid for if_exists".format(if_exists))
+    if chunksize is None:
+        chunksize = COPY_CHUNKSIZE
+    _check_chunksize(chunksize)
+    table = _quote(name)
+    if schema is not None:
+        table = '{0}.{1}'.format(_quote(schema), table)
+    geom_col = df._geometry_column_name
+    srid = _srid(df.crs)
+    names = list(df.columns)
+    columns = []
+    for col in names:
+        if col == geom_col:
+            columns.append(np.array(
+                [_ewkb_hex(g, srid) if isinstance(g, BaseGeometry) else None
+                 for g in df[col].values], dtype=object))
+        else:
+            columns.append(df[col].values)
+
+    cursor = con.cursor()
+    try:
+        cursor.execute(
+            "SELECT 1 FROM information_schema.tables WHERE table_name = %s "
+            "AND table_schema = COALESCE(%s, current_schema())",
+            (name, schema))
+        exists = cursor.fetchone() is not None
+        if exists and if_exists == 'fail':
+            raise ValueError('Table {0} already exists'.format(name))
+        if exists and if_exists == 'replace':
+            cursor.execute('DROP TABLE {0}'.format(table))
+        if not exists or if_exists == 'replace':
+            definitions = []
+            for col, values in zip(names, columns):
+                if col == geom_col:
+                    sql_type = 'geometry(Geometry, {0})'.format(srid)
+                else:
+                    sql_type = SQL_TYPES.get(values.dtype.kind, 'text')
+                definitions.append('{0} {1}'.format(_quote(col), sql_type))
+            cursor.execute('CREATE TABLE {0} ({1})'.format(
+                table, ', '.join(definitions)))
+        copy = 'COPY {0} ({1}) FROM STDIN'.format(
+            table, ', '.join(_quote(col) for col in names))
+        for start in range(0, len(df), chunksize):
+            cursor.copy_expert(copy, BytesIO(
+                _copy_text(columns, start, start + chunksize)))
+        con.commit()
+    except:
+        # don't leave the transaction aborted, or the table dropped by
+        # 'replace' gone if the caller commits
+        con.rollback()
+        raise
+    finally:
+        cursor.close()
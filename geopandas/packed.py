@@ -0,0 +1,483 @@
+"""
+Packed, array-based storage for geometries.
+
+A PackedGeometry keeps the vertices of many geometries in one contiguous
+float64 coordinate buffer, together with three levels of offsets:
+
+* ring_offsets: index of the first coordinate of each ring (a polygon
+  ring, a linestring, or the single coordinate of a point)
+* part_offsets: index of the first ring of each part (a polygon, a
+  linestring or a point)
+* geom_offsets: index of the first part of each geometry
+
+Every offset array has one more entry than the items it describes, so
+the items of entry ``i`` are ``offsets[i]:offsets[i + 1]``.  Shapely
+objects are only built when a geometry is requested.
+"""
+import numpy as np
+from shapely.geometry import (LinearRing, LineString, MultiLineString,
+                              MultiPoint, MultiPolygon, Point, Polygon)
+from shapely.geometry.base import BaseGeometry
+
+
+# Geometry type codes stored in PackedGeometry.types
+NONE = 0
+POINT = 1
+LINESTRING = 2
+POLYGON = 3
+MULTIPOINT = 4
+MULTILINESTRING = 5
+MULTIPOLYGON = 6
+LINEARRING = 7
+
+GEOM_TYPES = {'Point': POINT, 'LineString': LINESTRING, 'Polygon': POLYGON,
+              'MultiPoint': MULTIPOINT, 'MultiLineString': MULTILINESTRING,
+              'MultiPolygon': MULTIPOLYGON, 'LinearRing': LINEARRING}
+GEOM_TYPE_NAMES = dict((code, name) for name, code in GEOM_TYPES.items())
+
+# Gauss-Legendre nodes and weights of the integral in _geodesic_edge_area
+_GAUSS_NODES, _GAUSS_WEIGHTS = np.polynomial.legendre.leggauss(8)
+
+
+def _lengths(offsets):
+    return np.diff(offsets)
+
+
+def _offsets(lengths):
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return offsets
+
+
+def _geodesic_edge_area(lat1, lat2, az1, az2, geod):
+    """
+    Return the signed area between the equator and the geodesics from
+    latitudes *lat1* to *lat2* (degrees), which leave with azimuths *az1*
+    and arrive with back azimuths *az2* (degrees, as returned by
+    pyproj.Geod.inv), on the ellipsoid of *geod*.
+
+    This is S12 of C. F. F. Karney, "Algorithms for geodesics" (2013),
+    eqs. (58)-(61), with the integral I4 evaluated by Gauss-Legendre
+    quadrature on the auxiliary sphere.
+    """
+    a, es = geod.a, geod.es
+    alp1 = np.radians(az1)
+    alp2 = np.radians(az2) + np.pi
+    dalp = (alp2 - alp1 + np.pi) % (2 * np.pi) - np.pi
+    if es == 0:
+        return a * a * dalp
+    e = np.sqrt(es)
+    ep2 = es / (1 - es)
+    c2 = a * a / 2 * (1 + (1 - es) * np.arctanh(e) / e)
+    # reduced latitudes
+    beta1 = np.arctan(np.sqrt(1 - es) * np.tan(np.radians(lat1)))
+    beta2 = np.arctan(np.sqrt(1 - es) * np.tan(np.radians(lat2)))
+    # azimuth at the equator and arc lengths from it on the auxiliary sphere
+    salp0 = np.sin(alp1) * np.cos(beta1)
+    calp0 = np.hypot(np.cos(alp1), np.sin(alp1) * np.sin(beta1))
+    sig1 = np.arctan2(np.sin(beta1), np.cos(alp1) * np.cos(beta1))
+    sig2 = np.arctan2(np.sin(beta2), np.cos(alp2) * np.cos(beta2))
+
+    def t(x):
+        root = np.sqrt(x)
+        ratio = np.where(root > 0, np.arcsinh(root) /
+                         np.where(root > 0, root, 1), 1)
+        return x + np.sqrt(1 + x) * ratio
+
+    half = (sig2 - sig1) / 2
+    sig = ((sig1 + sig2) / 2)[:, np.newaxis] + \
+        half[:, np.newaxis] * _GAUSS_NODES
+    x = (ep2 * calp0 ** 2)[:, np.newaxis] * np.sin(sig) ** 2
+    # the denominator only vanishes along meridians, where salp0 is 0
+    denom = np.where(x == ep2, 1, ep2 - x)
+    integrand = (t(ep2) - t(x)) / denom * np.sin(sig) / 2
+    i4 = np.dot(integrand, _GAUSS_WEIGHTS) * half
+    return c2 * dalp - es * a * a * calp0 * salp0 * i4
+
+
+def _ragged_take(offsets, indices):
+    """Select items from a ragged array
+
+    Returns the offsets of the selected items and the positions of their
+    elements in the original array.
+    """
+    starts = offsets[indices]
+    lengths = offsets[indices + 1] - starts
+    new_offsets = _offsets(lengths)
+    positions = (np.arange(new_offsets[-1], dtype=np.int64) +
+                 np.repeat(starts - new_offsets[:-1], lengths))
+    return new_offsets, positions
+
+
+def _parts(geom):
+    """Return the type code and a list of parts (each a list of rings)"""
+    # empty geometries have no GEOS type in shapely, so use the class
+    geom_type = type(geom).__name__
+    if geom_type not in GEOM_TYPES:
+        geom_type = geom.geom_type
+    if geom.is_empty:
+        return GEOM_TYPES.get(geom_type, NONE), []
+    if geom_type == 'Point' or geom_type == 'LineString' or \
+            geom_type == 'LinearRing':
+        parts = [[np.asarray(geom.coords)]]
+    elif geom_type == 'Polygon':
+        parts = [_polygon_rings(geom)]
+    elif geom_type == 'MultiPoint' or geom_type == 'MultiLineString':
+        parts = [[np.asarray(g.coords)] for g in geom.geoms]
+    elif geom_type == 'MultiPolygon':
+        parts = [_polygon_rings(g) for g in geom.geoms]
+    else:
+        raise TypeError("Cannot pack geometry type '%s'" % geom_type)
+    return GEOM_TYPES[geom_type], parts
+
+
+def _polygon_rings(poly):
+    return ([np.asarray(poly.exterior.coords)] +
+            [np.asarray(ring.coords) for ring in poly.interiors])
+
+
+class PackedGeometry(object):
+    """
+    A sequence of geometries stored as flat coordinate and offset arrays.
+
+    Parameters
+    ----------
+    coords : (N, 2) or (N, 3) float64 array
+        Coordinates of every vertex of every geometry.
+    ring_offsets, part_offsets, geom_offsets : int64 arrays
+        Offsets into the coordinates, rings and parts respectively.
+    types : int8 array
+        Type code of each geometry, see GEOM_TYPES.  Missing geometries
+        (None) have type code 0.
+    """
+
+    def __init__(self, coords, ring_offsets, part_offsets, geom_offsets,
+                 types):
+        self.coords = coords
+        self.ring_offsets = ring_offsets
+        self.part_offsets = part_offsets
+        self.geom_offsets = geom_offsets
+        self.types = types
+
+    @classmethod
+    def from_shapely(cls, geoms):
+        """
+        Pack a sequence of shapely geometries.
+
+        Values which are not geometries (e.g. None or NaN) are stored as
+        missing.  Raises TypeError for geometry types that can't be
+        packed (GeometryCollection).
+        """
+        n = len(geoms)
+        types = np.zeros(n, dtype=np.int8)
+        part_counts = np.zeros(n, dtype=np.int64)
+        ring_counts = []
+        rings = []
+        for i, geom in enumerate(geoms):
+            if not isinstance(geom, BaseGeometry):
+                continue
+            types[i], parts = _parts(geom)
+            part_counts[i] = len(parts)
+            for part in parts:
+                ring_counts.append(len(part))
+                rings.extend(part)
+
+        ndim = max([r.shape[1] for r in rings] or [2])
+        if any(r.shape[1] != ndim for r in rings):
+            raise ValueError('Cannot pack mixed 2D and 3D coordinates')
+        if rings:
+            coords = np.concatenate(rings).astype(np.float64)
+        else:
+            coords = np.empty((0, ndim), dtype=np.float64)
+        ring_offsets = _offsets([len(r) for r in rings])
+        part_offsets = _offsets(ring_counts)
+        geom_offsets = _offsets(part_counts)
+        return cls(coords, ring_offsets, part_offsets, geom_offsets, types)
+
+    def __len__(self):
+        return len(self.types)
+
+    def __repr__(self):
+        return '<%s: %d geometries, %d coordinates>' % (
+            self.__class__.__name__, len(self), len(self.coords))
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._geometry(i)
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            if key < 0:
+                key += len(self)
+            if not 0 <= key < len(self):
+                raise IndexError('index out of range')
+            return self._geometry(key)
+        return self.take(key)
+
+    @property
+    def ndim(self):
+        """Number of coordinate dimensions (2 or 3)"""
+        return self.coords.shape[1]
+
+    @property
+    def nbytes(self):
+        """Total size of the coordinate and offset buffers in bytes"""
+        return sum(a.nbytes for a in (self.coords, self.ring_offsets,
+                                      self.part_offsets, self.geom_offsets,
+                                      self.types))
+
+    def _ring(self, r):
+        return self.coords[self.ring_offsets[r]:self.ring_offsets[r + 1]]
+
+    def _rings(self, p):
+        return [self._ring(r) for r in
+                range(self.part_offsets[p], self.part_offsets[p + 1])]
+
+    def _geometry(self, i):
+        """Build the shapely geometry at position i"""
+        code = self.types[i]
+        if code == NONE:
+            return None
+        parts = range(self.geom_offsets[i], self.geom_offsets[i + 1])
+        if code == POINT:
+            if not parts:
+                return Point()
+            return Point(self._ring(self.part_offsets[parts[0]])[0])
+        elif code == LINESTRING or code == LINEARRING:
+            klass = LineString if code == LINESTRING else LinearRing
+            if not parts:
+                return klass()
+            return klass(self._ring(self.part_offsets[parts[0]]))
+        elif code == POLYGON:
+            if not parts:
+                return Polygon()
+            rings = self._rings(parts[0])
+            return Polygon(rings[0], rings[1:])
+        elif code == MULTIPOINT:
+            return MultiPoint([self._ring(self.part_offsets[p])[0]
+                               for p in parts])
+        elif code == MULTILINESTRING:
+            return MultiLineString([self._ring(self.part_offsets[p])
+                                    for p in parts])
+        elif code == MULTIPOLYGON:
+            polys = []
+            for p in parts:
+                rings = self._rings(p)
+                polys.append((rings[0], rings[1:]))
+            return MultiPolygon(polys)
+        raise ValueError('Unknown geometry type code %d' % code)
+
+    def to_shapely(self):
+        """Return an object array with a shapely geometry for each entry"""
+        out = np.empty(len(self), dtype=object)
+        # points are built from Python floats, which is faster than
+        # slicing the coordinate array for each of them
+        points = (self.types == POINT) & (_lengths(self.geom_offsets) > 0)
+        coords = self.coords[self._coord_offsets()[:-1][points]].tolist()
+        for i, xy in zip(np.nonzero(points)[0], coords):
+            out[i] = Point(xy)
+        for i in np.nonzero(~points)[0]:
+            out[i] = self._geometry(i)
+        return out
+
+    def to_geojson(self):
+        """
+        Return a list of GeoJSON-like dicts (as shapely.geometry.mapping
+        gives) for each entry, or None for missing geometries.
+
+        The coordinates are converted to Python lists in one pass over the
+        coordinate buffer, without building shapely objects.
+        """
+        def split(items, offsets):
+            return [items[start:stop]
+                    for start, stop in zip(offsets[:-1], offsets[1:])]
+        rings = split(self.coords.tolist(), self.ring_offsets.tolist())
+        parts = split(rings, self.part_offsets.tolist())
+        out = []
+        for code, geom in zip(self.types.tolist(),
+                              split(parts, self.geom_offsets.tolist())):
+            if code == NONE:
+                out.append(None)
+                continue
+            if code == POINT:
+                coords = geom[0][0][0] if geom else []
+            elif code == LINESTRING or code == LINEARRING:
+                coords = geom[0][0] if geom else []
+            elif code == POLYGON:
+                coords = geom[0] if geom else []
+            elif code == MULTIPOINT:
+                coords = [part[0][0] for part in geom]
+            elif code == MULTILINESTRING:
+                coords = [part[0] for part in geom]
+            else:
+                coords = geom
+            out.append({'type': GEOM_TYPE_NAMES[code], 'coordinates': coords})
+        return out
+
+    def take(self, indices):
+        """
+        Return a new PackedGeometry with the geometries at *indices*.
+
+        *indices* may be anything that can index a 1-d numpy array:
+        integer positions, a slice or a boolean mask.
+        """
+        indices = np.arange(len(self), dtype=np.int64)[indices]
+        geom_offsets, parts = _ragged_take(self.geom_offsets, indices)
+        part_offsets, rings = _ragged_take(self.part_offsets, parts)
+        ring_offsets, coords = _ragged_take(self.ring_offsets, rings)
+        return PackedGeometry(self.coords[coords], ring_offsets,
+                              part_offsets, geom_offsets,
+                              self.types[indices])
+
+    def with_coords(self, coords):
+        """Return a PackedGeometry with the same layout but new coordinates"""
+        if len(coords) != len(self.coords):
+            raise ValueError('Expected %d coordinates, got %d' %
+                             (len(self.coords), len(coords)))
+        return PackedGeometry(coords, self.ring_offsets, self.part_offsets,
+                              self.geom_offsets, self.types)
+
+    #
+    # Mappings between the levels of the layout
+    #
+
+    def _coord_offsets(self):
+        """Offsets of the first coordinate of each geometry"""
+        return self.ring_offsets[self.part_offsets[self.geom_offsets]]
+
+    def _ring_geometry(self):
+        """Position of the geometry each ring belongs to"""
+        part_geom = np.repeat(np.arange(len(self)),
+                              _lengths(self.geom_offsets))
+        return part_geom[np.repeat(np.arange(len(self.part_offsets) - 1),
+                                   _lengths(self.part_offsets))]
+
+    def _segments(self):
+        """
+        Coordinate differences to the following vertex, with zeros for
+        the last vertex of each ring (where no segment starts).
+        """
+        xy = self.coords[:, :2]
+        delta = np.zeros_like(xy)
+        delta[:-1] = xy[1:] - xy[:-1]
+        delta[self.ring_offsets[1:] - 1] = 0
+        return delta
+
+    def _sum_rings(self, values):
+        """Sum per-coordinate *values* over each ring"""
+        n_rings = len(self.ring_offsets) - 1
+        return np.bincount(np.repeat(np.arange(n_rings),
+                                     _lengths(self.ring_offsets)),
+                           weights=values, minlength=n_rings)
+
+    def _sum_geometries(self, ring_values):
+        """Sum per-ring *ring_values* over each geometry"""
+        return np.bincount(self._ring_geometry(), weights=ring_values,
+                           minlength=len(self))
+
+    def _polygon_area(self, cross):
+        """
+        Return the area of each geometry from the per-coordinate terms of
+        twice the signed area of each ring
+        """
+        ring_geom = self._ring_geometry()
+        ring_area = np.abs(self._sum_rings(cross)) / 2.0
+        # the first ring of each part is the exterior, the others are holes
+        exterior = np.zeros(len(ring_area), dtype=bool)
+        exterior[self.part_offsets[:-1][_lengths(self.part_offsets) > 0]] = True
+        ring_area[~exterior] *= -1
+        polygonal = np.in1d(self.types, [POLYGON, MULTIPOLYGON])
+        ring_area[~polygonal[ring_geom]] = 0
+        return np.bincount(ring_geom, weights=ring_area,
+                           minlength=len(self))
+
+    #
+    # Vectorized properties
+    #
+
+    def bounds(self):
+        """
+        Return an (N, 4) array of minx, miny, maxx, maxy for each geometry.
+
+        Empty and missing geometries have NaN bounds.
+        """
+        out = np.empty((len(self), 4), dtype=np.float64)
+        out.fill(np.nan)
+        offsets = self._coord_offsets()
+        nonempty = offsets[1:] > offsets[:-1]
+        if nonempty.any():
+            starts = offsets[:-1][nonempty]
+            xy = self.coords[:, :2]
+            out[nonempty, :2] = np.minimum.reduceat(xy, starts, axis=0)
+            out[nonempty, 2:] = np.maximum.reduceat(xy, starts, axis=0)
+        return out
+
+    def total_bounds(self):
+        """Return the (minx, miny, maxx, maxy) of all coordinates"""
+        if not len(self.coords):
+            return (np.nan,) * 4
+        xy = self.coords[:, :2]
+        minx, miny = xy.min(axis=0)
+        maxx, maxy = xy.max(axis=0)
+        return (minx, miny, maxx, maxy)
+
+    def area(self):
+        """Return the planar area of each geometry"""
+        starts = self.ring_offsets[:-1]
+        # shift each ring to its first vertex for numerical stability, as
+        # GEOS does
+        x = self.coords[:, 0] - np.repeat(self.coords[starts, 0],
+                                          _lengths(self.ring_offsets))
+        y = self.coords[:, 1]
+        delta = self._segments()
+        return self._polygon_area(x * delta[:, 1] - y * delta[:, 0])
+
+    def length(self):
+        """Return the planar length (or perimeter) of each geometry"""
+        delta = self._segments()
+        seg_length = np.sqrt((delta ** 2).sum(axis=1))
+        return self._sum_geometries(self._sum_rings(seg_length))
+
+    def geodesic_area(self, geod):
+        """
+        Return the area of each geometry bounded by the geodesics of an
+        ellipsoid, in square units of its axes.
+
+        The coordinates are longitudes and latitudes in degrees and *geod*
+        is the pyproj.Geod of the ellipsoid.  Each edge contributes the
+        area between its geodesic and the equator (see
+        _geodesic_edge_area), which is accurate to about 0.1 square meters
+        per vertex on the Earth.  Rings must not enclose a pole.  Missing
+        geometries have a NaN area.
+        """
+        lon, lat = self.coords[:, 0], self.coords[:, 1]
+        terms = np.zeros(len(lon))
+        if len(lon) > 1:
+            az1, az2, dist = geod.inv(lon[:-1], lat[:-1], lon[1:], lat[1:])
+            terms[:-1] = _geodesic_edge_area(lat[:-1], lat[1:], az1, az2,
+                                             geod)
+            # repeated vertices don't add any area
+            terms[:-1][dist == 0] = 0
+        terms[self.ring_offsets[1:] - 1] = 0
+        area = self._polygon_area(2 * terms)
+        area[self.types == NONE] = np.nan
+        return area
+
+    def geodesic_length(self, geod):
+        """
+        Return the length (or perimeter) of each geometry along the
+        geodesics of an ellipsoid, in the units of its axes.
+
+        The coordinates are longitudes and latitudes in degrees and *geod*
+        is the pyproj.Geod of the ellipsoid.  Missing geometries have a NaN
+        length.
+        """
+        lon, lat = self.coords[:, 0], self.coords[:, 1]
+        seg_length = np.zeros(len(lon))
+        if len(lon) > 1:
+            seg_length[:-1] = geod.inv(lon[:-1], lat[:-1], lon[1:],
+                                       lat[1:])[2]
+        seg_length[self.ring_offsets[1:] - 1] = 0
+        length = self._sum_geometries(self._sum_rings(seg_length))
+        length[self.types == NONE] = np.nan
+        return length
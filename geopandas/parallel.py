@@ -0,0 +1,204 @@
+"""
+Chunked execution of elementwise geometry operations on a pool of workers.
+"""
+from functools import partial
+from itertools import chain
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+from multiprocessing.sharedctypes import RawArray
+
+import numpy as np
+
+ENGINES = ('serial', 'threads', 'processes')
+# Number of chunks per worker, so uneven chunks don't leave workers idle
+CHUNKS_PER_JOB = 4
+
+
+class Options(object):
+    """
+    Global geopandas options.
+
+    Attributes
+    ----------
+    engine : {'serial', 'threads', 'processes'}, default 'serial'
+        How elementwise geometry operations (buffer, simplify, union,
+        centroid, to_crs, ...) are run.  'threads' and 'processes' split
+        the GeoSeries into chunks that are processed on a pool of workers.
+        GEOS releases the GIL, so threads avoid the cost of pickling
+        geometries to other processes.
+    n_jobs : int or None, default None
+        Number of workers to use when *engine* isn't 'serial'.  None uses
+        the number of CPUs.
+    """
+
+    def __init__(self):
+        self._engine = 'serial'
+        self.n_jobs = None
+
+    def _get_engine(self):
+        return self._engine
+
+    def _set_engine(self, engine):
+        if engine not in ENGINES:
+            raise ValueError('Unknown engine {0}, must be one of {1}'.format(
+                engine, ENGINES))
+        self._engine = engine
+
+    engine = property(fget=_get_engine, fset=_set_engine,
+                      doc="Execution engine for elementwise operations")
+
+    def __repr__(self):
+        return 'Options(engine={0!r}, n_jobs={1!r})'.format(self.engine,
+                                                           self.n_jobs)
+
+
+options = Options()
+
+
+def _apply(func, args):
+    return func(*args)
+
+
+def _resolve_n_jobs(n_jobs):
+    if n_jobs is None:
+        n_jobs = options.n_jobs
+    if n_jobs is None:
+        n_jobs = multiprocessing.cpu_count()
+    return n_jobs
+
+
+def _splits(n, n_jobs):
+    """Return the (start, stop) bounds of the chunks of n items"""
+    splits = np.linspace(0, n, min(n, n_jobs * CHUNKS_PER_JOB) + 1)
+    splits = splits.astype(int)
+    return list(zip(splits[:-1], splits[1:]))
+
+
+def map_chunks(func, *arrays, **kwargs):
+    """
+    Apply *func* to aligned chunks of *arrays* and concatenate the results.
+
+    Parameters
+    ----------
+    func : callable
+        Called as ``func(chunk1, chunk2, ...)`` with one chunk of each
+        array; must return a list.  With the 'processes' engine func and
+        the arrays must be picklable, so use module level functions
+        (possibly wrapped in functools.partial).
+    arrays : sequences of equal length
+    n_jobs : int (optional)
+        Number of workers, overrides options.n_jobs.  Only used if
+        options.engine isn't 'serial'.
+
+    Returns
+    -------
+    list of the results for all elements, in order
+    """
+    n_jobs = _resolve_n_jobs(kwargs.pop('n_jobs', None))
+    if kwargs:
+        raise TypeError('Unexpected keyword arguments: {0}'.format(kwargs))
+    n = len(arrays[0])
+    if options.engine == 'serial' or n_jobs <= 1 or n < 2:
+        return func(*arrays)
+
+    chunks = [tuple(a[start:stop] for a in arrays)
+              for start, stop in _splits(n, n_jobs)]
+    if options.engine == 'threads':
+        pool = ThreadPool(n_jobs)
+    else:
+        pool = multiprocessing.Pool(n_jobs)
+    try:
+        results = pool.map(partial(_apply, func), chunks)
+    finally:
+        pool.terminate()
+    return list(chain.from_iterable(results))
+
+
+# The shared array of map_rows in the worker processes
+_shared = {}
+
+
+def _init_shared(buf, shape):
+    _shared['array'] = np.frombuffer(buf, dtype=np.float64).reshape(shape)
+
+
+def _apply_shared(func, bounds):
+    start, stop = bounds
+    array = _shared['array']
+    array[start:stop] = func(array[start:stop])
+
+
+def map_rows(func, array, n_jobs=None):
+    """
+    Apply *func* to chunks of rows of a float64 array and return the
+    assembled result.
+
+    Parameters
+    ----------
+    func : callable
+        Called as ``func(chunk)`` with a chunk of rows of *array*; must
+        return an array of the same shape.  With the 'processes' engine
+        func must be picklable, as for map_chunks.
+    array : 2-d float64 array
+    n_jobs : int (optional)
+        Number of workers, overrides options.n_jobs.  Only used if
+        options.engine isn't 'serial'.
+
+    With the 'processes' engine the rows are copied once into shared
+    memory, which the workers update in place, and the result is a view
+    of that memory, so no chunk is pickled or copied back.
+    """
+    n_jobs = _resolve_n_jobs(n_jobs)
+    n = len(array)
+    if options.engine == 'serial' or n_jobs <= 1 or n < 2:
+        return func(array)
+
+    chunks = _splits(n, n_jobs)
+    if options.engine == 'threads':
+        out = np.empty_like(array, dtype=np.float64)
+
+        def apply(bounds):
+            start, stop = bounds
+            out[start:stop] = func(array[start:stop])
+        pool = ThreadPool(n_jobs)
+        try:
+            pool.map(apply, chunks)
+        finally:
+            pool.terminate()
+        return out
+
+    buf = RawArray('d', array.size)
+    out = np.frombuffer(buf, dtype=np.float64).reshape(array.shape)
+    out[...] = array
+    pool = multiprocessing.Pool(n_jobs, initializer=_init_shared,
+                                initargs=(buf, array.shape))
+    try:
+        pool.map(partial(_apply_shared, func), chunks)
+    finally:
+        pool.terminate()
+    return out
+
+
+#
+# Chunk functions for the elementwise GeoSeries operations
+#
+
+def call_method(geoms, op, args=(), kwargs=None):
+    """Return [geom.op(*args, **kwargs) for geom in geoms]"""
+    kwargs = kwargs or {}
+    return [getattr(geom, op)(*args, **kwargs) for geom in geoms]
+
+
+def call_binary(geoms, others, op):
+    """Return [geom.op(other) for each pair of geometries]"""
+    return [getattr(geom, op)(other) for geom, other in zip(geoms, others)]
+
+
+def get_attribute(geoms, op):
+    """Return [geom.op for geom in geoms]"""
+    return [getattr(geom, op) for geom in geoms]
+
+
+def unpack(packed):
+    """Return the shapely geometries of a PackedGeometry as a list"""
+    return list(packed.to_shapely())
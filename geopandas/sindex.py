@@ -0,0 +1,166 @@
+"""
+Spatial index over the bounding boxes of a GeoSeries.
+"""
+import numpy as np
+
+HILBERT_ORDER = 16
+QUERY_CHUNKSIZE = 10000
+
+
+def _hilbert_distance(x, y, order=HILBERT_ORDER):
+    """
+    Return the distance along a Hilbert curve of integer grid coordinates
+
+    x and y are integer arrays in [0, 2**order).
+    """
+    n = 2 ** order
+    x = x.astype(np.int64)
+    y = y.astype(np.int64)
+    d = np.zeros(len(x), dtype=np.int64)
+    s = n // 2
+    while s > 0:
+        rx = (x & s) > 0
+        ry = (y & s) > 0
+        d += s * s * ((3 * rx) ^ ry)
+        # rotate the quadrant so the curve stays continuous
+        flip = rx & ~ry
+        x = np.where(flip, n - 1 - x, x)
+        y = np.where(flip, n - 1 - y, y)
+        x, y = np.where(ry, x, y), np.where(ry, y, x)
+        s //= 2
+    return d
+
+
+def _hilbert_order(bounds):
+    """Return the order of the boxes along a Hilbert curve of their centers"""
+    if not len(bounds):
+        return np.array([], dtype=np.int64)
+    cx = (bounds[:, 0] + bounds[:, 2]) / 2.0
+    cy = (bounds[:, 1] + bounds[:, 3]) / 2.0
+    scale = 2 ** HILBERT_ORDER - 1
+
+    def grid(c):
+        width = c.max() - c.min()
+        if width == 0:
+            return np.zeros(len(c), dtype=np.int64)
+        return np.floor((c - c.min()) / width * scale).astype(np.int64)
+    return np.argsort(_hilbert_distance(grid(cx), grid(cy)), kind='mergesort')
+
+
+def _intersecting(bounds, boxes):
+    """Return True where bounds[i] intersects boxes[i] (edges inclusive)"""
+    return ((bounds[:, 0] <= boxes[:, 2]) & (bounds[:, 2] >= boxes[:, 0]) &
+            (bounds[:, 1] <= boxes[:, 3]) & (bounds[:, 3] >= boxes[:, 1]))
+
+
+class SpatialIndex(object):
+    """
+    A packed R-tree over a set of bounding boxes.
+
+    The items are sorted along a Hilbert curve and then packed into nodes
+    of *node_capacity* consecutive entries, level by level, so the tree
+    is a single array of boxes per level and the children of node ``j``
+    are entries ``j * node_capacity`` to ``(j + 1) * node_capacity - 1``
+    of the level below.  The tree can't be modified once built.
+
+    Parameters
+    ----------
+    bounds : (N, 4) array
+        minx, miny, maxx, maxy of each item.  Items with NaN bounds
+        (empty or missing geometries) are not indexed.
+    node_capacity : int, default 16
+        Maximum number of children of each node.
+    """
+
+    def __init__(self, bounds, node_capacity=16):
+        bounds = np.asarray(bounds, dtype=np.float64).reshape(-1, 4)
+        self.node_capacity = node_capacity
+        ids = np.nonzero(~np.isnan(bounds).any(axis=1))[0]
+        order = _hilbert_order(bounds[ids])
+        self._ids = ids[order]
+        # levels[0] holds the items, levels[-1] the children of the root
+        levels = [bounds[self._ids]]
+        while len(levels[-1]) > node_capacity:
+            levels.append(self._parent_bounds(levels[-1]))
+        self._levels = levels
+
+    def _parent_bounds(self, bounds):
+        starts = np.arange(0, len(bounds), self.node_capacity)
+        return np.column_stack([
+            np.minimum.reduceat(bounds[:, 0], starts),
+            np.minimum.reduceat(bounds[:, 1], starts),
+            np.maximum.reduceat(bounds[:, 2], starts),
+            np.maximum.reduceat(bounds[:, 3], starts)])
+
+    def __len__(self):
+        return len(self._ids)
+
+    def _query_pairs(self, boxes):
+        """
+        Return (box positions, item positions) of every pair of a query box
+        and an item whose bounds intersect.
+        """
+        boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+        m = self.node_capacity
+        top = len(self._levels[-1])
+        box_idx = np.repeat(np.arange(len(boxes)), top)
+        node_idx = np.tile(np.arange(top), len(boxes))
+        for level in range(len(self._levels) - 1, -1, -1):
+            hit = _intersecting(self._levels[level][node_idx],
+                                boxes[box_idx])
+            box_idx, node_idx = box_idx[hit], node_idx[hit]
+            if level == 0:
+                break
+            # descend to the children of the nodes that were hit
+            node_idx = (node_idx[:, np.newaxis] * m + np.arange(m)).ravel()
+            box_idx = np.repeat(box_idx, m)
+            valid = node_idx < len(self._levels[level - 1])
+            box_idx, node_idx = box_idx[valid], node_idx[valid]
+        return box_idx, self._ids[node_idx]
+
+    def query_bulk(self, bounds):
+        """
+        Return all pairs of a query box and an item with intersecting bounds
+
+        Parameters
+        ----------
+        bounds : (M, 4) array
+            minx, miny, maxx, maxy of each query box.  Boxes with NaN
+            bounds match nothing.
+
+        Returns
+        -------
+        (box positions, item positions) : two integer arrays, sorted by box
+        """
+        bounds = np.asarray(bounds, dtype=np.float64).reshape(-1, 4)
+        box_idx, items = [np.array([], dtype=np.int64)], [self._ids[:0]]
+        # query in chunks to bound the size of the intermediate arrays
+        for start in range(0, len(bounds), QUERY_CHUNKSIZE):
+            chunk_idx, chunk_items = self._query_pairs(
+                bounds[start:start + QUERY_CHUNKSIZE])
+            box_idx.append(chunk_idx + start)
+            items.append(chunk_items)
+        box_idx = np.concatenate(box_idx)
+        items = np.concatenate(items)
+        order = np.lexsort((items, box_idx))
+        return box_idx[order], items[order]
+
+    def query(self, geometry):
+        """
+        Return the positions of the items whose bounds intersect the bounds
+        of *geometry*.
+
+        Parameters
+        ----------
+        geometry : shapely geometry or (minx, miny, maxx, maxy) tuple
+
+        Returns
+        -------
+        positions : sorted array of integer positions
+        """
+        bounds = getattr(geometry, 'bounds', geometry)
+        if not len(self) or not len(bounds) or np.isnan(bounds).any():
+            return np.array([], dtype=np.int64)
+        _, items = self._query_pairs(bounds)
+        items.sort()
+        return items
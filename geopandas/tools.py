@@ -0,0 +1,88 @@
+from warnings import warn
+
+import numpy as np
+from pandas import DataFrame
+
+from geopandas import GeoDataFrame
+
+
+def _take_rows(df, positions):
+    """Return the rows of *df* at *positions*; -1 gives a row of NaN"""
+    return DataFrame(df).reset_index(drop=True).reindex(positions)
+
+
+def sjoin(left_df, right_df, how='inner', op='intersects',
+          lsuffix='left', rsuffix='right'):
+    """
+    Spatial join of two GeoDataFrames.
+
+    Candidate pairs are found with the spatial index of *right_df* and
+    then tested with the exact predicate (see GeoSeries.predicate_matrix).
+
+    Parameters
+    ----------
+    left_df, right_df : GeoDataFrames
+    how : {'inner', 'left', 'right'}, default 'inner'
+        * inner: keep the pairs that satisfy the predicate; the index
+          and geometry of left_df are kept
+        * left: like inner, but also keep rows of left_df without a match
+        * right: keep the index and geometry of right_df, and also keep
+          rows of right_df without a match
+    op : {'intersects', 'contains', 'within'}, default 'intersects'
+        Binary predicate, evaluated as ``left_geom.op(right_geom)``.
+    lsuffix, rsuffix : str
+        Suffixes for the index column of the other side ('index_right' or
+        'index_left') and for overlapping column names.
+
+    Returns
+    -------
+    GeoDataFrame with the columns of both sides
+    """
+    if how not in ('inner', 'left', 'right'):
+        raise ValueError('Unknown join type {0}'.format(how))
+    if op not in ('intersects', 'contains', 'within'):
+        raise ValueError('Unknown spatial predicate {0}'.format(op))
+    if left_df.crs != right_df.crs:
+        warn('CRS of frames being joined does not match: {0} and {1}'.format(
+            left_df.crs, right_df.crs))
+
+    l_idx, r_idx = left_df.geometry._predicate_pairs(right_df.geometry, op)
+
+    if how == 'left':
+        unmatched = np.setdiff1d(np.arange(len(left_df)), l_idx)
+        l_idx = np.concatenate([l_idx, unmatched])
+        r_idx = np.concatenate([r_idx, -np.ones(len(unmatched), dtype=int)])
+        order = np.lexsort((r_idx, l_idx))
+    elif how == 'right':
+        unmatched = np.setdiff1d(np.arange(len(right_df)), r_idx)
+        r_idx = np.concatenate([r_idx, unmatched])
+        l_idx = np.concatenate([l_idx, -np.ones(len(unmatched), dtype=int)])
+        order = np.lexsort((l_idx, r_idx))
+    else:
+        order = np.lexsort((r_idx, l_idx))
+    l_idx, r_idx = l_idx[order], r_idx[order]
+
+    # only the geometry of the side whose index is kept is returned
+    if how == 'right':
+        geo_df, keep_idx = right_df, r_idx
+        left_df = left_df.drop(left_df._geometry_column_name, axis=1)
+    else:
+        geo_df, keep_idx = left_df, l_idx
+        right_df = right_df.drop(right_df._geometry_column_name, axis=1)
+
+    left = _take_rows(left_df, l_idx)
+    right = _take_rows(right_df, r_idx)
+    for col in left.columns & right.columns:
+        left = left.rename(columns={col: '{0}_{1}'.format(col, lsuffix)})
+        right = right.rename(columns={col: '{0}_{1}'.format(col, rsuffix)})
+    if how == 'right':
+        left['index_{0}'.format(lsuffix)] = _take_rows(
+            DataFrame({'index': left_df.index}), l_idx)['index'].values
+    else:
+        left['index_{0}'.format(rsuffix)] = _take_rows(
+            DataFrame({'index': right_df.index}), r_idx)['index'].values
+    for col in right.columns:
+        left[col] = right[col].values
+    left.index = geo_df.index.take(keep_idx)
+    return GeoDataFrame(left, crs=geo_df.crs,
+                        geometry=geo_df._geometry_column_name)
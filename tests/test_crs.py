@@ -0,0 +1,112 @@
+import copy
+import json
+import pickle
+
+import pyproj
+from shapely.geometry import Point
+
+from geopandas import GeoDataFrame, GeoSeries, crs
+from geopandas.crs import CRS, _LRUCache, as_crs, crs_key, get_projections
+from .util import unittest
+
+
+class TestCRS(unittest.TestCase):
+
+    def test_crs_key(self):
+        self.assertEqual(crs_key({'init': 'EPSG:4326', 'no_defs': True}),
+                         crs_key({'no_defs': True, 'init': 'epsg:4326'}))
+        self.assertNotEqual(crs_key({'init': 'epsg:4326'}),
+                            crs_key({'init': 'epsg:2263'}))
+        self.assertEqual(crs_key(' +init=epsg:4326 '),
+                         crs_key({'init': 'epsg:4326'}))
+        self.assertEqual(crs_key({'+proj': 'utm', 'zone': '18'}),
+                         crs_key({'proj': 'utm', 'zone': 18}))
+        hash(crs_key({'proj': 'longlat', 'towgs84': [0, 0, 0]}))
+
+    def test_lru_cache(self):
+        cache = _LRUCache(2)
+        cache['a'] = 1
+        cache['b'] = 2
+        self.assertEqual(cache.get('a'), 1)
+        cache['c'] = 3
+        # 'b' was used least recently
+        self.assertEqual(len(cache), 2)
+        self.assertTrue(cache.get('b') is None)
+        self.assertEqual(cache.get('a'), 1)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_get_projections(self):
+        crs._projections.clear()
+        wgs84 = {'init': 'epsg:4326', 'no_defs': True}
+        projections = get_projections(wgs84, {'init': 'epsg:26918'})
+        self.assertTrue(all(isinstance(p, pyproj.Proj) for p in projections))
+        self.assertTrue(get_projections({'no_defs': True,
+                                         'init': 'EPSG:4326'},
+                                        {'init': 'epsg:26918'})
+                        is projections)
+        self.assertTrue(get_projections({'init': 'epsg:26918'}, wgs84)
+                        is not projections)
+        self.assertEqual(len(crs._projections), 2)
+
+
+class TestCRSObject(unittest.TestCase):
+
+    def setUp(self):
+        self.wgs84 = CRS({'init': 'epsg:4326', 'no_defs': True})
+
+    def test_interned(self):
+        self.assertTrue(CRS({'no_defs': True, 'init': 'EPSG:4326'})
+                        is self.wgs84)
+        self.assertTrue(CRS('+init=epsg:4326 +no_defs') is self.wgs84)
+        self.assertTrue(CRS(self.wgs84) is self.wgs84)
+        self.assertTrue(CRS(4326) is self.wgs84)
+        self.assertTrue(as_crs(None) is None)
+        self.assertEqual(hash(CRS({'init': 'epsg:4326', 'no_defs': True})),
+                         hash(self.wgs84))
+
+    def test_equality(self):
+        self.assertEqual(self.wgs84, {'init': 'epsg:4326', 'no_defs': True})
+        self.assertEqual({'init': 'epsg:4326', 'no_defs': True}, self.wgs84)
+        # strings hash differently, so they don't compare equal
+        self.assertNotEqual(self.wgs84, '+no_defs +init=epsg:4326')
+        self.assertEqual(self.wgs84, CRS('+no_defs +init=epsg:4326'))
+        self.assertFalse('+init=epsg:4326 +no_defs' in set([self.wgs84]))
+        self.assertNotEqual(self.wgs84, {'init': 'epsg:4326'})
+        self.assertNotEqual(self.wgs84, CRS('epsg:2263'))
+        self.assertNotEqual(self.wgs84, None)
+        self.assertFalse(self.wgs84 == 'not a crs')
+
+    def test_values(self):
+        # numbers given as strings are kept, but compare as numbers
+        utm = CRS({'proj': 'utm', '+zone': ' 17 ', 'ellps': 'clrk66'})
+        self.assertEqual(utm.to_dict(),
+                         {'proj': 'utm', 'zone': '17', 'ellps': 'clrk66'})
+        self.assertEqual(utm, {'proj': 'utm', 'zone': 17.0,
+                               'ellps': 'clrk66'})
+        self.assertEqual(CRS('+proj=utm +zone=17 +ellps=GRS80')['zone'], 17)
+
+    def test_immutable(self):
+        with self.assertRaises(TypeError):
+            self.wgs84['init'] = 'epsg:2263'
+        with self.assertRaises(TypeError):
+            self.wgs84.update(proj='utm')
+        self.assertTrue(copy.deepcopy(self.wgs84) is self.wgs84)
+
+    def test_roundtrip(self):
+        self.assertEqual(self.wgs84.to_dict(),
+                         {'init': 'epsg:4326', 'no_defs': True})
+        self.assertTrue(type(self.wgs84.to_dict()) is dict)
+        self.assertEqual(json.loads(json.dumps(self.wgs84)), self.wgs84)
+        self.assertTrue(pickle.loads(pickle.dumps(self.wgs84)) is self.wgs84)
+
+    def test_geoseries_crs(self):
+        s = GeoSeries([Point(0, 0), Point(1, 1)],
+                      crs={'init': 'epsg:4326', 'no_defs': True})
+        self.assertTrue(s.crs is self.wgs84)
+        self.assertTrue(s[:1].crs is self.wgs84)
+        df = GeoDataFrame({'geometry': s}, crs='+init=epsg:4326 +no_defs')
+        self.assertTrue(df.crs is self.wgs84)
+        self.assertTrue(df[:1].crs is self.wgs84)
+        df.crs = None
+        self.assertTrue(df.crs is None)
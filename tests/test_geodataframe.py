@@ -135,6 +135,14 @@ class TestDataFrame(unittest.TestCase):
         self.assertEqual(new_df.crs, self.df.crs)
         self.assertEqual(new_df.geometry.crs, self.df.crs)
 
+    def test_set_geometry_invalidates_cache(self):
+        geom = self.df2.geometry
+        self.assertEqual(geom.total_bounds, (0, 0, 9, 9))
+        self.df2.set_geometry([Point(x, -x) for x in range(10)],
+                              inplace=True)
+        self.assertEqual(self.df2.geometry.total_bounds, (0, -9, 9, 0))
+        self.assertTrue(geom._get_cached('bounds') is None)
+
     def test_set_geometry_col(self):
         g = self.df.geometry
         g_simplified = g.simplify(100)
@@ -217,6 +225,21 @@ class TestDataFrame(unittest.TestCase):
                 self.assertTrue(np.isnan(props['Shape_Leng']))
                 self.assertTrue('Shape_Area' in props)
 
+    def test_to_json_chunksize(self):
+        text = self.df.to_json()
+        self.assertEqual(self.df.to_json(chunksize=2), text)
+        self.assertEqual(''.join(self.df.iter_geojson(chunksize=3)), text)
+        # the packed coordinates give the same features
+        self.df.geometry.to_packed()
+        self.assertEqual(json.loads(self.df.to_json(chunksize=2)),
+                         json.loads(text))
+        tempfilename = os.path.join(self.tempdir, 'boros.json')
+        self.df.to_json(path_or_buf=tempfilename, chunksize=2)
+        with open(tempfilename) as f:
+            self.assertEqual(json.load(f), json.loads(text))
+        with self.assertRaises(ValueError):
+            self.df.iter_geojson(na='foo')
+
     def test_copy(self):
         df2 = self.df.copy()
         self.assertTrue(type(df2) is GeoDataFrame)
@@ -232,6 +255,19 @@ class TestDataFrame(unittest.TestCase):
         self.assertTrue(len(df) == 5)
         self.assertTrue(np.alltrue(df['BoroName'].values == self.boros))
 
+    def test_to_file_chunksize(self):
+        tempfilename = os.path.join(self.tempdir, 'boros.shp')
+        calls = []
+        self.df.to_file(tempfilename, chunksize=2,
+                        progress=lambda done, total: calls.append((done,
+                                                                   total)))
+        self.assertEqual(calls, [(2, 5), (4, 5), (5, 5)])
+        df = GeoDataFrame.from_file(tempfilename)
+        self.assertEqual(list(df['BoroName']), list(self.df['BoroName']))
+        self.assertEqual(list(df['BoroCode']), list(self.df['BoroCode']))
+        for a, b in zip(df['geometry'], self.df['geometry']):
+            self.assertTrue(a.equals(b))
+
     def test_mixed_types_to_file(self):
         """ Test that mixed geometry types raise error when writing to file """
         tempfilename = os.path.join(self.tempdir, 'test.shp')
@@ -2,12 +2,14 @@ import os
 import shutil
 import tempfile
 import numpy as np
-from numpy.testing import assert_array_equal
+from numpy.testing import assert_array_equal, assert_array_almost_equal
 from pandas import Series
 from shapely.geometry import (Polygon, Point, LineString,
-                              MultiPoint, MultiLineString, MultiPolygon)
+                              MultiPoint, MultiLineString, MultiPolygon,
+                              GeometryCollection)
 from shapely.geometry.base import BaseGeometry
-from geopandas import GeoSeries
+from geopandas import GeoSeries, geoseries
+from geopandas.geoseries import _transform
 from .util import unittest, geom_equals, geom_almost_equals
 
 
@@ -94,6 +96,33 @@ class TestSeries(unittest.TestCase):
         assert_array_equal(self.g1.bounds.values, np.array([[0, 0, 1, 1],
                                                             [0, 0, 1, 1]]))
 
+    def test_bounds_empty(self):
+        bounds = self.na_none.bounds
+        self.assertTrue(np.isnan(bounds.values[2]).all())
+        assert_array_equal(bounds.values[:2], np.array([[0, 0, 1, 1],
+                                                        [0, 0, 1, 1]]))
+        self.assertEqual(self.na.total_bounds, (0, 0, 1, 1))
+
+    def test_bounds_cache(self):
+        s = GeoSeries([Point(x, x) for x in range(5)], crs=self.g3.crs)
+        self.assertEqual(s.total_bounds, (0, 0, 4, 4))
+        bounds = s._bounds_array()
+        self.assertTrue(s._bounds_array() is bounds)
+        # copies and subsets keep (a subset of) the cached bounds
+        self.assertTrue(s.copy()._get_cached('bounds') is not None)
+        sub = s[s.index > 2]
+        assert_array_equal(sub._get_cached('bounds'),
+                           np.array([[3, 3, 3, 3], [4, 4, 4, 4]]))
+        taken = s.take([4, 0])
+        assert_array_equal(taken._get_cached('bounds'),
+                           np.array([[4, 4, 4, 4], [0, 0, 0, 0]]))
+        # mutation invalidates
+        s[0] = Point(-1, -1)
+        self.assertEqual(s.total_bounds, (-1, -1, 4, 4))
+        s.iloc[1] = Point(10, 10)
+        self.assertEqual(s.total_bounds, (-1, -1, 10, 10))
+        self.assertEqual(taken.total_bounds, (0, 0, 4, 4))
+
     def test_contains(self):
         self.assertTrue(np.alltrue(self.g1.contains(self.t1)))
         self.assertFalse(np.alltrue(self.g1.contains(Point([5, 5]))))
@@ -102,10 +131,61 @@ class TestSeries(unittest.TestCase):
         l = np.array([2 + np.sqrt(2), 4])
         assert_array_equal(self.g1.length.values, l)
 
+    def test_geodesic_length(self):
+        # WGS84: a degree of the equator and of a meridian at the equator
+        s = GeoSeries([LineString([(0, 0), (1, 0), (1, 1)]), self.esb, None],
+                      crs={'init': 'epsg:4326'})
+        length = s.geodesic_length()
+        self.assertTrue(type(length) is Series)
+        assert_array_almost_equal(length.values[:2],
+                                  [111319.4908 + 110574.3886, 0],
+                                  decimal=3)
+        self.assertTrue(length.isnull()[2])
+        sphere = s.geodesic_length(ellps='sphere')
+        self.assertAlmostEqual(sphere[0], 2 * 6370997.0 * np.pi / 180, 3)
+        # measuring doesn't keep packed coordinates with the series
+        self.assertTrue(s._get_cached('packed') is None)
+        chunksize = geoseries.GEODESIC_CHUNKSIZE
+        geoseries.GEODESIC_CHUNKSIZE = 2
+        try:
+            assert_array_equal(s.geodesic_length(), length)
+            s.to_packed()
+            assert_array_equal(s.geodesic_length(), length)
+        finally:
+            geoseries.GEODESIC_CHUNKSIZE = chunksize
+
+    def test_geodesic_area(self):
+        # WGS84 areas of polygons bounded by geodesics, from GeographicLib
+        cell = Polygon([(0, 0), (1, 0), (1, 1), (0, 1)])
+        north = Polygon([(179, 60), (-180, 60), (-180, 62), (179, 62)])
+        holed = Polygon([(0, 0), (2, 0), (2, 2), (0, 2)],
+                        [[(1, 0), (2, 0), (2, 1), (1, 1)]])
+        large = Polygon([(-120, 30), (-60, 40), (-80, 60), (-130, 55)])
+        s = GeoSeries([cell, north, holed, large, self.l1, None],
+                      crs={'init': 'epsg:4326'})
+        area = s.geodesic_area()
+        self.assertTrue(type(area) is Series)
+        expected = np.array([12308778361.5, 12057254261.6,
+                             49231584297.4 - 12308778361.5,
+                             10570673548708.4])
+        assert_array_almost_equal(area.values[:4] / expected, np.ones(4),
+                                  decimal=6)
+        self.assertEqual(area[4], 0)
+        self.assertTrue(area.isnull()[5])
+        with self.assertRaises(ValueError):
+            self.landmarks.to_crs(epsg=3857).geodesic_area()
+
     def test_equals(self):
         self.assertTrue(np.alltrue(self.g1.equals(self.g1)))
         assert_array_equal(self.g1.equals(self.sq), [False, True])
 
+    def test_equals_empty(self):
+        s = GeoSeries([self.sq, Polygon(), None])
+        assert_array_equal(s.equals(Polygon()), [False, True, False])
+        assert_array_equal(s.equals(self.sq), [True, False, False])
+        self.assertTrue(Polygon() in s)
+        self.assertFalse(Polygon() in self.g1)
+
     def test_equals_align(self):
         a = self.a1.equals(self.a2)
         self.assertFalse(a['A'])
@@ -162,6 +242,19 @@ class TestSeries(unittest.TestCase):
         self.assertTrue(all(self.g3.equals(s)))
         # TODO: compare crs
 
+    def test_from_wkb(self):
+        wkb = [self.t1.wkb_hex, self.sq.wkb, None, memoryview(self.t2.wkb),
+               bytearray(self.l1.wkb), u'' + self.esb.wkb_hex]
+        s = GeoSeries.from_wkb(wkb, index=list('abcdef'), crs=self.g3.crs)
+        self.assertEqual(s.crs, self.g3.crs)
+        self.assertEqual(list(s.index), list('abcdef'))
+        self.assertTrue(s['c'] is None)
+        for key, geom in zip('abdef', [self.t1, self.sq, self.t2, self.l1,
+                                       self.esb]):
+            self.assertTrue(s[key].equals(geom))
+        with self.assertRaises(ValueError):
+            GeoSeries.from_wkb([b'\x01\x02'])
+
     @unittest.skip('TODO')
     def test_within(self):
         # TODO
@@ -248,6 +341,34 @@ class TestSeries(unittest.TestCase):
         with self.assertRaises(TypeError):
             self.landmarks.to_crs(crs=None, epsg=None)
 
+    def test_transform_vectorized(self):
+        poly = Polygon([(0, 0), (2, 0), (2, 2), (0, 2)],
+                       [[(0.5, 0.5), (1, 0.5), (1, 1)]])
+        geoms = [self.esb, None, LineString([(-74, 40), (-73, 41)]), poly,
+                 MultiPoint([self.esb, self.sol])]
+        s = GeoSeries(geoms, index=list('abcde'), crs=self.landmarks.crs)
+        s.name = 'geoms'
+        result = s.to_crs(epsg=26918)
+        self.assertEqual(result.name, 'geoms')
+        self.assertEqual(list(result.index), list('abcde'))
+        self.assertTrue(result['b'] is None)
+        # packed coordinates are only kept if they were asked for
+        self.assertTrue(result._get_cached('packed') is None)
+        self.assertTrue(s._get_cached('packed') is None)
+        s.to_packed()
+        self.assertTrue(s.to_crs(epsg=26918)._get_cached('packed')
+                        is not None)
+        expected = _transform([g for g in geoms if g is not None], s.crs,
+                              result.crs)
+        for geom, exp in zip(result.drop('b'), expected):
+            self.assertTrue(geom.almost_equals(exp, 6))
+        # geometry collections are transformed one by one
+        s = GeoSeries([GeometryCollection([self.esb, self.sol])],
+                      crs=self.landmarks.crs)
+        result = s.to_crs(epsg=26918)
+        self.assertTrue(result[0].almost_equals(
+            _transform(s.values, s.crs, result.crs)[0], 6))
+
     def test_fillna(self):
         na = self.na_none.fillna(Point())
         self.assertTrue(isinstance(na[2], BaseGeometry))
@@ -1,12 +1,242 @@
+import os
+import shutil
+import sqlite3
+import tempfile
 import unittest
 
-from geopandas import GeoDataFrame, read_postgis, read_file
+import fiona
+import numpy as np
+from pandas import DataFrame
+import pandas as pd
+from shapely.geometry import Point, box
+from shapely.geos import lgeos
+
+from geopandas import (GeoDataFrame, GeoSeries, read_postgis, read_file,
+                       read_geojsonseq, read_parquet)
+from geopandas.io.native import open_native, read_native
+from geopandas.io.sql import _copy_text, _ewkb_hex, _filter_query, _srid
 import tests.util
 
+
+def _skip_if_no_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise unittest.SkipTest("pyarrow not installed. Skipping")
+
+
 class TestIO(unittest.TestCase):
     def setUp(self):
         nybb_filename = tests.util.download_nybb()
-        self.df = read_file('/nybb_13a/nybb.shp', vfs='zip://' + nybb_filename)
+        self.nybb_vfs = 'zip://' + nybb_filename
+        self.df = read_file('/nybb_13a/nybb.shp', vfs=self.nybb_vfs)
+        self.tempdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def test_read_file_chunksize(self):
+        chunks = list(read_file('/nybb_13a/nybb.shp', vfs=self.nybb_vfs,
+                                chunksize=2))
+        self.assertEqual([len(c) for c in chunks], [2, 2, 1])
+        for chunk in chunks:
+            self.assertTrue(isinstance(chunk, GeoDataFrame))
+            self.assertEqual(chunk.crs, self.df.crs)
+        np.testing.assert_array_equal(
+            np.concatenate([c.index for c in chunks]), self.df.index)
+        np.testing.assert_array_equal(
+            np.concatenate([c['BoroName'] for c in chunks]),
+            self.df['BoroName'])
+
+    def test_read_file_columns(self):
+        df = read_file('/nybb_13a/nybb.shp', vfs=self.nybb_vfs,
+                       columns=['BoroName', 'BoroCode'])
+        self.assertTrue(isinstance(df, GeoDataFrame))
+        self.assertEqual(sorted(df.columns),
+                         ['BoroCode', 'BoroName', 'geometry'])
+        np.testing.assert_array_equal(df['BoroName'], self.df['BoroName'])
+        with self.assertRaises(ValueError):
+            read_file('/nybb_13a/nybb.shp', vfs=self.nybb_vfs,
+                      columns=['foo'])
+
+    def test_read_file_ignore_geometry(self):
+        df = read_file('/nybb_13a/nybb.shp', vfs=self.nybb_vfs,
+                       columns=['BoroName'], ignore_geometry=True)
+        self.assertTrue(type(df) is DataFrame)
+        self.assertEqual(list(df.columns), ['BoroName'])
+        self.assertEqual(len(df), 5)
+
+    def test_read_file_rows(self):
+        df = read_file('/nybb_13a/nybb.shp', vfs=self.nybb_vfs,
+                       rows=slice(1, 3))
+        np.testing.assert_array_equal(df['BoroName'],
+                                      self.df['BoroName'].values[1:3])
+        df = read_file('/nybb_13a/nybb.shp', vfs=self.nybb_vfs,
+                       max_features=2)
+        np.testing.assert_array_equal(df['BoroName'],
+                                      self.df['BoroName'].values[:2])
+        s = GeoSeries.from_file('/nybb_13a/nybb.shp', vfs=self.nybb_vfs,
+                                rows=3)
+        self.assertEqual(len(s), 3)
+        self.assertEqual(s.crs, self.df.crs)
+
+    def test_read_file_missing_properties(self):
+        filename = os.path.join(self.tempdir, 'missing.json')
+        schema = {'geometry': 'Point',
+                  'properties': {'a': 'int', 'b': 'float', 'c': 'str',
+                                 'd': 'date', 'e': 'int'}}
+        props = [{'a': 1, 'b': 0.5, 'c': 'x', 'd': '2014-01-02', 'e': 3},
+                 {'a': None, 'b': None, 'c': None, 'd': None, 'e': 4}]
+        with fiona.open(filename, 'w', driver='GeoJSON',
+                        schema=schema) as f:
+            for i, p in enumerate(props):
+                f.write({'geometry': {'type': 'Point', 'coordinates': (i, i)},
+                         'properties': p})
+        df = read_file(filename)
+        self.assertEqual(df['a'].dtype, np.float64)
+        self.assertTrue(np.isnan(df['a'][1]))
+        self.assertTrue(np.isnan(df['b'][1]))
+        self.assertEqual(df['c'][0], 'x')
+        self.assertTrue(np.isnan(df['c'][1]))
+        self.assertEqual(df['d'].dtype, 'M8[ns]')
+        self.assertTrue(df['d'].isnull()[1])
+        self.assertEqual(df['e'].dtype, np.int64)
+        self.assertEqual(list(df['e']), [3, 4])
+
+    def test_geojsonseq(self):
+        filename = os.path.join(self.tempdir, 'boros.geojsonl')
+        self.df.to_geojsonseq(filename, chunksize=2)
+        with open(filename) as f:
+            self.assertEqual(len(f.readlines()), 5)
+        df = read_geojsonseq(filename)
+        self.assertTrue(isinstance(df, GeoDataFrame))
+        self.assertEqual(list(df['BoroName']), list(self.df['BoroName']))
+        for a, b in zip(df.geometry, self.df.geometry):
+            self.assertTrue(a.equals(b))
+        # appending and reading in chunks
+        self.df.iloc[:1].to_geojsonseq(filename, mode='a')
+        chunks = list(read_geojsonseq(filename, chunksize=4))
+        self.assertEqual([len(c) for c in chunks], [4, 2])
+        self.assertEqual(list(chunks[1].index), [4, 5])
+
+    def test_read_geojsonseq_byte_range(self):
+        filename = os.path.join(self.tempdir, 'boros.geojsonl')
+        self.df.to_geojsonseq(filename)
+        size = os.path.getsize(filename)
+        for n in [1, 2, 3, 7]:
+            splits = [i * size // n for i in range(n + 1)]
+            names = []
+            for start, stop in zip(splits[:-1], splits[1:]):
+                df = read_geojsonseq(filename, byte_range=(start, stop))
+                if len(df):
+                    names.extend(df['BoroName'])
+            self.assertEqual(names, list(self.df['BoroName']))
+
+    def test_read_geojsonseq_missing(self):
+        filename = os.path.join(self.tempdir, 'points.geojsonl')
+        with open(filename, 'w') as f:
+            f.write('\x1e{"type": "Feature", "properties": {"a": 1}, '
+                    '"geometry": {"type": "Point", "coordinates": [1, 2]}}\n'
+                    '\n'
+                    '{"type": "Feature", "properties": {"b": "x"}, '
+                    '"geometry": null}\n')
+        df = read_geojsonseq(filename)
+        self.assertEqual(len(df), 2)
+        self.assertTrue(np.isnan(df['a'][1]))
+        self.assertEqual(df['b'][1], 'x')
+        self.assertTrue(df.geometry[1] is None)
+        self.assertEqual(df.crs, {'init': 'epsg:4326'})
+
+    def test_parquet(self):
+        _skip_if_no_pyarrow()
+        filename = os.path.join(self.tempdir, 'boros.parquet')
+        self.df.to_parquet(filename, row_group_size=2)
+        df = read_parquet(filename)
+        self.assertTrue(isinstance(df, GeoDataFrame))
+        self.assertEqual(df.crs, self.df.crs)
+        self.assertEqual(list(df.columns), list(self.df.columns))
+        np.testing.assert_array_equal(df.index, self.df.index)
+        for col in ['BoroCode', 'BoroName', 'Shape_Area']:
+            np.testing.assert_array_equal(df[col], self.df[col])
+        self.assertEqual(df['BoroCode'].dtype, self.df['BoroCode'].dtype)
+        for a, b in zip(df.geometry, self.df.geometry):
+            self.assertTrue(a.equals(b))
+
+    def test_parquet_missing_row_group(self):
+        _skip_if_no_pyarrow()
+        filename = os.path.join(self.tempdir, 'boros.parquet')
+        df = self.df.copy()
+        df['BoroName'] = [None, np.nan] + list(df['BoroName'][2:])
+        df.to_parquet(filename, row_group_size=2)
+        result = read_parquet(filename)
+        self.assertTrue(result['BoroName'][:2].isnull().all())
+        self.assertEqual(list(result['BoroName'][2:]),
+                         list(self.df['BoroName'][2:]))
+        df['BoroName'] = list(self.df['BoroName'][:4]) + [None]
+        df.to_parquet(filename, row_group_size=2)
+        result = read_parquet(filename)
+        self.assertTrue(np.isnan(result['BoroName'][4]))
+
+    def test_read_parquet_selection(self):
+        _skip_if_no_pyarrow()
+        filename = os.path.join(self.tempdir, 'boros.parquet')
+        df = self.df.copy()
+        df.index = df.index + 10
+        df.rename(columns={'geometry': 'boros'}).set_geometry(
+            'boros').to_parquet(filename, row_group_size=2)
+        df = read_parquet(filename, columns=['BoroName'], row_groups=[1, 2])
+        self.assertEqual(list(df.columns), ['BoroName', 'boros'])
+        self.assertEqual(df._geometry_column_name, 'boros')
+        self.assertEqual(list(df.index), [12, 13, 14])
+        np.testing.assert_array_equal(df['BoroName'],
+                                      self.df['BoroName'].values[2:])
+        with self.assertRaises(ValueError):
+            read_parquet(filename, columns=['foo'])
+        df = read_parquet(filename, columns=['BoroName', 'boros'])
+        self.assertEqual(list(df.columns), ['BoroName', 'boros'])
+        bbox = self.df.geometry[3].bounds
+        df = read_parquet(filename, bbox=bbox)
+        expected = self.df.geometry.bounds
+        expected = ((expected['minx'] <= bbox[2]) &
+                    (expected['maxx'] >= bbox[0]) &
+                    (expected['miny'] <= bbox[3]) &
+                    (expected['maxy'] >= bbox[1]))
+        self.assertEqual(list(df.index), list(self.df.index[expected] + 10))
+
+    def test_native(self):
+        path = os.path.join(self.tempdir, 'boros')
+        s = self.df.geometry
+        s.to_native(path)
+        packed = open_native(path)
+        self.assertTrue(isinstance(packed.coords, np.memmap))
+        np.testing.assert_array_equal(packed.bounds(), s.bounds.values)
+        result = read_native(path)
+        self.assertEqual(result.crs, s.crs)
+        np.testing.assert_array_equal(result.index, s.index)
+        for a, b in zip(result, s):
+            self.assertTrue(a.equals(b))
+        self.assertTrue(result._get_cached('packed') is not None)
+
+    def test_native_rows(self):
+        path = os.path.join(self.tempdir, 'points')
+        s = GeoSeries([Point(i, i) for i in range(5)] + [None],
+                      index=list('abcdef'), crs={'init': 'epsg:4326'})
+        s.name = 'points'
+        s.to_native(path)
+        result = read_native(path, rows=[4, 1, 5])
+        self.assertEqual(list(result.index), ['e', 'b', 'f'])
+        self.assertEqual(result.name, 'points')
+        self.assertTrue(result[0].equals(Point(4, 4)))
+        self.assertTrue(result['f'] is None)
+        # the index is stored without pickling
+        index = np.load(os.path.join(path, 'index.npy'), allow_pickle=False)
+        self.assertEqual(list(index), list('abcdef'))
+        with self.assertRaises(TypeError):
+            GeoSeries([Point(0, 0), Point(1, 1)],
+                      index=['a', (1, 2)]).to_native(path)
+        # overwriting with an empty series
+        GeoSeries([]).to_native(path)
+        self.assertEqual(len(read_native(path)), 0)
 
     def test_read_postgis_default(self):
         con = tests.util.connect('test_geopandas')
@@ -36,3 +266,149 @@ class TestIO(unittest.TestCase):
             con.close()
 
         tests.util.validate_boro_df(self, df)
+
+    def test_read_postgis_chunksize(self):
+        con = tests.util.connect('test_geopandas')
+        if con is None or not tests.util.create_db(self.df):
+            raise unittest.case.SkipTest()
+
+        try:
+            sql = "SELECT * FROM nybb;"
+            chunks = list(read_postgis(sql, con, chunksize=2))
+        finally:
+            con.close()
+
+        self.assertEqual([len(c) for c in chunks], [2, 2, 1])
+        tests.util.validate_boro_df(self, pd.concat(chunks))
+
+    def test_read_postgis_chunksize_dbapi(self):
+        # drivers without named cursors fall back to a regular cursor
+        con = sqlite3.connect(':memory:')
+        try:
+            con.execute('CREATE TABLE points (id INTEGER, geom TEXT)')
+            con.executemany('INSERT INTO points VALUES (?, ?)',
+                            [(i, Point(i, i).wkb_hex) for i in range(5)])
+            chunks = list(read_postgis('SELECT * FROM points', con,
+                                       index_col='id', chunksize=2))
+        finally:
+            con.close()
+
+        self.assertEqual([len(c) for c in chunks], [2, 2, 1])
+        for chunk in chunks:
+            self.assertTrue(isinstance(chunk, GeoDataFrame))
+            for i, geom in zip(chunk.index, chunk.geometry):
+                self.assertTrue(geom.equals(Point(i, i)))
+
+    def test_to_postgis(self):
+        con = tests.util.connect('test_geopandas')
+        if con is None:
+            raise unittest.case.SkipTest()
+
+        df = self.df.copy()
+        df.crs = {'init': 'epsg:2263'}
+        try:
+            df.to_postgis('nybb_copy', con, if_exists='replace', chunksize=2)
+            with self.assertRaises(ValueError):
+                df.to_postgis('nybb_copy', con)
+            df.to_postgis('nybb_copy', con, if_exists='append')
+            result = read_postgis('SELECT * FROM "nybb_copy"', con,
+                                  geom_col='geometry')
+            cursor = con.cursor()
+            cursor.execute('SELECT DISTINCT ST_SRID(geometry) '
+                           'FROM "nybb_copy"')
+            srids = cursor.fetchall()
+        finally:
+            con.close()
+
+        self.assertEqual(len(result), 10)
+        self.assertEqual(srids, [(2263,)])
+        self.assertEqual(list(result['BoroName'][:5]),
+                         list(self.df['BoroName']))
+        for a, b in zip(result.geometry[:5], self.df.geometry):
+            self.assertTrue(a.equals(b))
+
+    def test_to_postgis_failed_replace(self):
+        con = tests.util.connect('test_geopandas')
+        if con is None:
+            raise unittest.case.SkipTest()
+
+        bad = self.df.copy()
+        # too large for a bigint, so the COPY fails after the DROP
+        bad['big'] = np.array([2 ** 64 - 1] * 5, dtype=np.uint64)
+        try:
+            self.df.to_postgis('nybb_copy', con, if_exists='replace')
+            with self.assertRaises(tests.util.psycopg2.DataError):
+                bad.to_postgis('nybb_copy', con, if_exists='replace')
+            con.commit()
+            result = read_postgis('SELECT * FROM "nybb_copy"', con,
+                                  geom_col='geometry')
+        finally:
+            con.close()
+
+        self.assertEqual(len(result), 5)
+        self.assertFalse('big' in result.columns)
+
+    def test_ewkb_hex(self):
+        geom = self.df.geometry[0]
+        ewkb = _ewkb_hex(geom, 2263)
+        result = GeoSeries.from_wkb([ewkb])[0]
+        self.assertTrue(result.equals(geom))
+        self.assertEqual(lgeos.GEOSGetSRID(result._geom), 2263)
+        self.assertEqual(_ewkb_hex(geom, 0), geom.wkb_hex.lower())
+        self.assertEqual(_srid({'init': 'epsg:4326', 'no_defs': True}), 4326)
+        self.assertEqual(_srid('+init=EPSG:2263'), 2263)
+        self.assertEqual(_srid({'proj': 'longlat'}), 0)
+
+    def test_copy_text(self):
+        columns = [np.array([1, 2]), np.array([0.5, np.nan]),
+                   np.array([u'a\tb', None], dtype=object),
+                   np.array([True, False])]
+        self.assertEqual(_copy_text(columns, 0, 2),
+                         b'1\t0.5\ta\\tb\tt\n2\t\\N\t\\N\tf\n')
+
+    def test_read_postgis_bbox(self):
+        con = tests.util.connect('test_geopandas')
+        if con is None or not tests.util.create_db(self.df):
+            raise unittest.case.SkipTest()
+
+        bbox = self.df.geometry[3].bounds
+        mask = self.df.geometry[3]
+        try:
+            sql = "SELECT * FROM nybb;"
+            df = read_postgis(sql, con, bbox=bbox,
+                              columns=['boroname'])
+            masked = read_postgis(sql, con, mask=mask)
+        finally:
+            con.close()
+
+        self.assertEqual(list(df.columns), ['boroname', 'geom'])
+        expected = self.df[[box(*g.bounds).intersects(box(*bbox))
+                            for g in self.df.geometry]]
+        self.assertEqual(sorted(df['boroname']),
+                         sorted(expected['BoroName']))
+        expected = self.df[self.df.geometry.intersects(mask)]
+        self.assertEqual(sorted(masked['boroname']),
+                         sorted(expected['BoroName']))
+
+    def test_filter_query(self):
+        crs = {'init': 'epsg:2263'}
+        sql, params = _filter_query("SELECT * FROM t WHERE a LIKE 'x%';",
+                                    None, 'geom', crs, None, None,
+                                    (0, 1, 2, 3), None, ['a', 'geom'])
+        self.assertEqual(sql, 'SELECT q."a", q."geom" FROM '
+                              '(SELECT * FROM t WHERE a LIKE \'x%%\') AS q '
+                              'WHERE q."geom" && '
+                              'ST_MakeEnvelope(%s, %s, %s, %s, %s)')
+        self.assertEqual(params, [0, 1, 2, 3, 2263])
+        sql, params = _filter_query('SELECT * FROM t WHERE b = %(b)s', None,
+                                    'geom', crs, 'id', {'b': 1}, None,
+                                    Point(0, 0), ['a'])
+        self.assertTrue(sql.startswith('SELECT q."a", q."id", q."geom" '))
+        self.assertTrue(sql.endswith(
+            "ST_Intersects(q.\"geom\", ST_GeomFromWKB("
+            "decode(%(_geopandas_0)s, 'hex'), %(_geopandas_1)s))"))
+        self.assertEqual(params, {'b': 1, '_geopandas_0': Point(0, 0).wkb_hex,
+                                  '_geopandas_1': 2263})
+        with self.assertRaises(ValueError):
+            _filter_query('SELECT * FROM t', None, 'geom', crs, None, None,
+                          (0, 1, 2, 3), Point(0, 0), None)
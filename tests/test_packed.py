@@ -0,0 +1,116 @@
+import json
+
+import numpy as np
+from numpy.testing import assert_array_equal, assert_array_almost_equal
+from shapely.geometry import (Point, LineString, LinearRing, Polygon,
+                              MultiPoint, MultiLineString, MultiPolygon, mapping)
+
+from geopandas import GeoSeries
+from geopandas.packed import PackedGeometry
+from .util import unittest
+
+
+class TestPackedGeometry(unittest.TestCase):
+
+    def setUp(self):
+        self.poly = Polygon([(0, 0), (4, 0), (4, 4), (0, 4)],
+                            [[(1, 1), (2, 1), (2, 2), (1, 2)]])
+        self.geoms = [
+            Point(1, 2),
+            LineString([(0, 0), (3, 4), (3, 5)]),
+            self.poly,
+            None,
+            MultiPoint([(1, 1), (2, 3)]),
+            MultiLineString([[(0, 0), (1, 0)], [(5, 5), (5, 7)]]),
+            MultiPolygon([self.poly, Polygon([(10, 10), (11, 10), (11, 11)])]),
+            Polygon(),
+            LinearRing([(0, 0), (1, 0), (1, 1)]),
+        ]
+        self.packed = PackedGeometry.from_shapely(self.geoms)
+
+    def test_layout(self):
+        p = self.packed
+        self.assertEqual(len(p), len(self.geoms))
+        self.assertEqual(p.ndim, 2)
+        self.assertEqual(p.geom_offsets[-1], len(p.part_offsets) - 1)
+        self.assertEqual(p.part_offsets[-1], len(p.ring_offsets) - 1)
+        self.assertEqual(p.ring_offsets[-1], len(p.coords))
+
+    def test_roundtrip(self):
+        for geom, result in zip(self.geoms, self.packed.to_shapely()):
+            if geom is None:
+                self.assertTrue(result is None)
+            else:
+                self.assertEqual(geom.geom_type, result.geom_type)
+                self.assertTrue(geom.equals(result) or
+                                (geom.is_empty and result.is_empty))
+        self.assertTrue(self.packed[-1].equals(self.geoms[-1]))
+
+    def test_3d(self):
+        packed = PackedGeometry.from_shapely([Point(1, 2, 3),
+                                              LineString([(0, 0, 1),
+                                                          (1, 1, 2)])])
+        self.assertEqual(packed.ndim, 3)
+        self.assertEqual(packed[0].z, 3)
+        self.assertTrue(packed[1].has_z)
+
+    def test_to_geojson(self):
+        result = self.packed.to_geojson()
+        for geom, mapped in zip(self.geoms, result):
+            if geom is None:
+                self.assertTrue(mapped is None)
+            elif geom.is_empty:
+                self.assertEqual(mapped['coordinates'], [])
+            else:
+                expected = json.loads(json.dumps(mapping(geom)))
+                self.assertEqual(json.loads(json.dumps(mapped)), expected)
+
+    def test_take(self):
+        sub = self.packed.take([6, 2, -1])
+        self.assertEqual(len(sub), 3)
+        self.assertTrue(sub[0].equals(self.geoms[6]))
+        self.assertTrue(sub[1].equals(self.geoms[2]))
+        self.assertTrue(sub[2].equals(self.geoms[-1]))
+        mask = np.array([g is not None for g in self.geoms])
+        self.assertEqual(len(self.packed[mask]), len(self.geoms) - 1)
+        self.assertEqual(len(self.packed[2:4]), 2)
+
+    def test_vectorized_properties(self):
+        geoms = [g for g in self.geoms if g is not None and not g.is_empty]
+        packed = PackedGeometry.from_shapely(geoms)
+        assert_array_almost_equal(packed.area(), [g.area for g in geoms])
+        assert_array_almost_equal(packed.length(), [g.length for g in geoms])
+        assert_array_equal(packed.bounds(), [g.bounds for g in geoms])
+        self.assertEqual(packed.total_bounds(), (0, 0, 11, 11))
+
+    def test_missing_bounds(self):
+        bounds = self.packed.bounds()
+        self.assertTrue(np.isnan(bounds[3]).all())
+        self.assertTrue(np.isnan(bounds[7]).all())
+        self.assertEqual(tuple(bounds[0]), (1, 2, 1, 2))
+
+
+class TestGeoSeriesPacked(unittest.TestCase):
+
+    def setUp(self):
+        self.sq = Polygon([(0, 0), (1, 0), (1, 1), (0, 1)])
+        self.g = GeoSeries([self.sq, Point(0, 0), LineString([(0, 0), (1, 1)])],
+                           index=['a', 'b', 'c'], crs={'init': 'epsg:4326'})
+
+    def test_from_packed(self):
+        packed = self.g.to_packed()
+        g = GeoSeries.from_packed(packed, index=self.g.index, crs=self.g.crs)
+        self.assertTrue(type(g) is GeoSeries)
+        self.assertEqual(g.crs, self.g.crs)
+        self.assertTrue(g.to_packed() is packed)
+        self.assertTrue(g.equals(self.g).all())
+        assert_array_almost_equal(g.area.values, self.g.area.values)
+        assert_array_almost_equal(g.length.values, [4, 0, np.sqrt(2)])
+        assert_array_equal(g.bounds.values, [[0, 0, 1, 1], [0, 0, 0, 0],
+                                             [0, 0, 1, 1]])
+
+    def test_setitem_drops_packed(self):
+        packed = self.g.to_packed()
+        self.g['a'] = Point(5, 5)
+        self.assertTrue(self.g.to_packed() is not packed)
+        self.assertEqual(self.g.area['a'], 0)
@@ -0,0 +1,78 @@
+from functools import partial
+
+import numpy as np
+from shapely.geometry import LineString, Point
+
+import geopandas
+from geopandas import GeoSeries
+from geopandas.parallel import options, map_chunks, map_rows, call_binary
+from .util import unittest, geom_almost_equals
+
+
+class TestParallel(unittest.TestCase):
+
+    def setUp(self):
+        self.crs = {'init': 'epsg:4326', 'no_defs': True}
+        self.pts = GeoSeries([Point(x, x / 2.) for x in range(50)],
+                             index=range(100, 150), crs=self.crs)
+        self.engine = options.engine
+
+    def tearDown(self):
+        options.engine = self.engine
+
+    def test_options(self):
+        self.assertTrue(geopandas.options is options)
+        with self.assertRaises(ValueError):
+            options.engine = 'gpu'
+
+    def test_map_chunks(self):
+        for engine in ['serial', 'threads', 'processes']:
+            options.engine = engine
+            result = map_chunks(partial(call_binary, op='distance'),
+                                self.pts.values, self.pts.values[::-1],
+                                n_jobs=3)
+            self.assertEqual(len(result), 50)
+            self.assertEqual(result[0], self.pts[149].distance(self.pts[100]))
+            self.assertEqual(result[25], 0.5 * 5 ** 0.5)
+
+    def test_engines(self):
+        expected = self.pts.buffer(1)
+        expected_union = self.pts.union(Point(0, 0))
+        expected_centroid = expected.centroid
+        for engine in ['threads', 'processes']:
+            options.engine = engine
+            result = self.pts.buffer(1, n_jobs=3)
+            self.assertTrue(type(result) is GeoSeries)
+            self.assertEqual(result.crs, self.crs)
+            self.assertTrue(result.index.equals(self.pts.index))
+            self.assertTrue(geom_almost_equals(result, expected))
+            self.assertTrue(geom_almost_equals(self.pts.union(Point(0, 0)),
+                                               expected_union))
+            self.assertTrue(geom_almost_equals(result.centroid,
+                                               expected_centroid))
+            simple = result.simplify(0.1, n_jobs=2)
+            self.assertTrue(simple.index.equals(self.pts.index))
+
+    def test_map_rows(self):
+        coords = np.arange(202, dtype=float).reshape(101, 2)
+        for engine in ['serial', 'threads', 'processes']:
+            options.engine = engine
+            result = map_rows(np.negative, coords, n_jobs=3)
+            self.assertEqual(result.shape, coords.shape)
+            self.assertTrue(np.array_equal(result, -coords))
+            # the input isn't modified
+            self.assertEqual(coords[100, 1], 201)
+
+    def test_to_crs(self):
+        lines = GeoSeries([LineString([(x, 0), (x + 1, 1), (x, 2)])
+                           for x in range(-50, 50)], crs=self.crs)
+        expected = lines.to_crs(epsg=3857)
+        for engine in ['threads', 'processes']:
+            options.engine = engine
+            result = lines.to_crs(epsg=3857, n_jobs=3)
+            self.assertTrue(type(result) is GeoSeries)
+            self.assertEqual(result.crs, expected.crs)
+            self.assertTrue(result.index.equals(lines.index))
+            self.assertTrue(geom_almost_equals(result, expected))
+            for geom, exp in zip(result, expected):
+                self.assertTrue(np.array_equal(geom.coords, exp.coords))
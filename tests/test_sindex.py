@@ -0,0 +1,114 @@
+import numpy as np
+from numpy.testing import assert_array_equal
+from shapely.geometry import Point, Polygon, box
+
+from geopandas import GeoSeries
+from geopandas.sindex import SpatialIndex
+from .util import unittest
+
+
+def _skip_if_no_scipy():
+    try:
+        import scipy
+    except ImportError:
+        raise unittest.SkipTest("scipy not installed. Skipping")
+
+
+class TestSpatialIndex(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.RandomState(42)
+        xy = rng.uniform(0, 100, size=(1000, 2))
+        wh = rng.uniform(0, 3, size=(1000, 2))
+        self.bounds = np.column_stack([xy, xy + wh])
+        self.bounds[[3, 500]] = np.nan
+
+    def brute_force(self, query):
+        b = self.bounds
+        hit = ((b[:, 0] <= query[2]) & (b[:, 2] >= query[0]) &
+               (b[:, 1] <= query[3]) & (b[:, 3] >= query[1]))
+        return np.nonzero(hit)[0]
+
+    def test_query(self):
+        sindex = SpatialIndex(self.bounds, node_capacity=4)
+        self.assertEqual(len(sindex), 998)
+        for query in [(10, 10, 20, 30), (0, 0, 100, 100), (50, 50, 50, 50),
+                      (-10, -10, -5, -5)]:
+            assert_array_equal(sindex.query(query), self.brute_force(query))
+
+    def test_query_geometry(self):
+        sindex = SpatialIndex(self.bounds)
+        poly = Polygon([(20, 20), (40, 25), (30, 60)])
+        assert_array_equal(sindex.query(poly),
+                           self.brute_force(poly.bounds))
+        self.assertEqual(len(sindex.query(Polygon())), 0)
+
+    def test_empty(self):
+        sindex = SpatialIndex(np.empty((0, 4)))
+        self.assertEqual(len(sindex.query((0, 0, 1, 1))), 0)
+
+
+class TestGeoSeriesSpatialIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.squares = GeoSeries([box(x, y, x + 1, y + 1)
+                                  for x in range(20) for y in range(20)])
+
+    def test_sindex_cached(self):
+        sindex = self.squares.sindex
+        self.assertTrue(self.squares.sindex is sindex)
+        self.squares[0] = box(50, 50, 51, 51)
+        self.assertTrue(self.squares.sindex is not sindex)
+
+    def test_pruned_predicates(self):
+        query = Polygon([(2.5, 2.5), (8.5, 3), (5, 9)])
+        for op in ['intersects', 'contains', 'within', 'touches',
+                   'disjoint']:
+            expected = [getattr(g, op)(query) for g in self.squares]
+            result = getattr(self.squares, op)(query)
+            assert_array_equal(result.values, expected)
+        pt = Point(3, 3)
+        self.assertEqual(self.squares.touches(pt).sum(), 4)
+        self.assertEqual(self.squares.disjoint(pt).sum(), 396)
+
+    def test_prepared_predicates(self):
+        query = Polygon([(2.5, 2.5), (8.5, 3), (5, 9)])
+        pts = GeoSeries([Point(x / 2., y / 2.) for x in range(20)
+                         for y in range(20)])
+        expected = dict((op, getattr(self.squares, op)(query).values)
+                        for op in ['intersects', 'contains', 'within',
+                                   'touches', 'disjoint', 'overlaps'])
+        self.assertTrue(self.squares.prepare() is self.squares)
+        self.assertEqual(len(self.squares._get_cached('prepared')), 400)
+        for op, values in expected.items():
+            assert_array_equal(getattr(self.squares, op)(query).values,
+                               values)
+        assert_array_equal(pts.within(query).values,
+                           [p.within(query) for p in pts])
+        self.squares[0] = box(50, 50, 51, 51)
+        self.assertTrue(self.squares._get_cached('prepared') is None)
+
+    def test_predicate_matrix(self):
+        _skip_if_no_scipy()
+        polys = GeoSeries([box(0, 0, 2, 2), box(10, 10, 11, 11),
+                           box(1, 1, 3, 3)])
+        for op in ['intersects', 'contains', 'within', 'touches']:
+            m = self.squares.predicate_matrix(polys, op)
+            self.assertEqual(m.shape, (400, 3))
+            expected = np.array([[getattr(a, op)(b) for b in polys]
+                                 for a in self.squares])
+            assert_array_equal(m.toarray(), expected)
+            # prepared geometries on either side give the same result
+            m = GeoSeries(self.squares).prepare().predicate_matrix(polys, op)
+            assert_array_equal(m.toarray(), expected)
+            m = self.squares.predicate_matrix(polys.copy().prepare(), op)
+            assert_array_equal(m.toarray(), expected)
+        # empty geometries have no envelope, but equal each other
+        polys = GeoSeries([Polygon(), box(0, 0, 1, 1), Polygon()])
+        squares = GeoSeries([box(0, 0, 1, 1), Polygon(), None])
+        m = squares.predicate_matrix(polys, 'equals')
+        assert_array_equal(m.toarray(), [[False, True, False],
+                                          [True, False, True],
+                                          [False, False, False]])
+        with self.assertRaises(ValueError):
+            self.squares.predicate_matrix(polys, 'distance')
@@ -0,0 +1,58 @@
+import numpy as np
+from numpy.testing import assert_array_equal
+from shapely.geometry import Point, box
+
+from geopandas import GeoDataFrame, sjoin
+from .util import unittest
+
+
+class TestSpatialJoin(unittest.TestCase):
+
+    def setUp(self):
+        self.crs = {'init': 'epsg:4326'}
+        self.polys = GeoDataFrame(
+            {'geometry': [box(0, 0, 10, 10), box(5, 5, 15, 15),
+                          box(20, 20, 30, 30)],
+             'name': ['a', 'b', 'c'], 'value': [1, 2, 3]},
+            index=['A', 'B', 'C'], crs=self.crs)
+        self.points = GeoDataFrame(
+            {'geometry': [Point(1, 1), Point(7, 7), Point(12, 12),
+                          Point(50, 50)],
+             'value': [10, 20, 30, 40]},
+            crs=self.crs)
+
+    def test_inner(self):
+        df = sjoin(self.points, self.polys, op='within')
+        self.assertTrue(isinstance(df, GeoDataFrame))
+        self.assertEqual(df.crs, self.crs)
+        assert_array_equal(df.index, [0, 1, 1, 2])
+        assert_array_equal(df['index_right'], ['A', 'A', 'B', 'B'])
+        assert_array_equal(df['name'], ['a', 'a', 'b', 'b'])
+        assert_array_equal(df['value_left'], [10, 20, 20, 30])
+        assert_array_equal(df['value_right'], [1, 1, 2, 2])
+        self.assertTrue(df.geometry.equals(self.points.geometry[df.index])
+                        .all())
+
+    def test_left(self):
+        df = sjoin(self.points, self.polys, how='left', op='within')
+        assert_array_equal(df.index, [0, 1, 1, 2, 3])
+        self.assertTrue(np.isnan(df['value_right'].iloc[-1]))
+
+    def test_right(self):
+        df = sjoin(self.points, self.polys, how='right', op='within')
+        assert_array_equal(df.index, ['A', 'A', 'B', 'B', 'C'])
+        assert_array_equal(df['index_left'].iloc[:4], [0, 1, 1, 2])
+        self.assertTrue(df.geometry.equals(self.polys.geometry[df.index])
+                        .all())
+        self.assertTrue(np.isnan(df['value_left'].iloc[-1]))
+
+    def test_contains(self):
+        df = sjoin(self.polys, self.points, op='contains')
+        assert_array_equal(df.index, ['A', 'A', 'B', 'B'])
+        assert_array_equal(df['index_right'], [0, 1, 1, 2])
+
+    def test_bad_args(self):
+        with self.assertRaises(ValueError):
+            sjoin(self.points, self.polys, how='outer')
+        with self.assertRaises(ValueError):
+            sjoin(self.points, self.polys, op='touches')